@@ -1,19 +1,38 @@
 """Top-level package for outcome."""
 
+from ._aggregate import (
+    gather_outcomes as gather_outcomes,
+    partition as partition,
+)
+from ._decorators import acaptured as acaptured, captured as captured
+from ._drive import adrive as adrive, drive as drive, step as step
+from ._gather import acapture_gather as acapture_gather
 from ._impl import (
+    CapturedBatch as CapturedBatch,
     Error as Error,
     Maybe as Maybe,
     Outcome as Outcome,
     Value as Value,
     acapture as acapture,
     capture as capture,
+    capture_light as capture_light,
+    capture_many as capture_many,
+)
+from ._iter import (
+    acapture_iter as acapture_iter,
+    acapture_iter_chunks as acapture_iter_chunks,
+    capture_iter as capture_iter,
+    capture_iter_chunks as capture_iter_chunks,
 )
 from ._util import AlreadyUsedError as AlreadyUsedError, fixup_module_metadata
 from ._version import __version__ as __version__
 
 __all__ = (
-    'Error', 'Outcome', 'Value', 'Maybe', 'acapture', 'capture',
-    'AlreadyUsedError'
+    'CapturedBatch', 'Error', 'Outcome', 'Value', 'Maybe', 'acapture',
+    'acapture_gather', 'acapture_iter', 'acapture_iter_chunks', 'acaptured',
+    'adrive', 'capture', 'capture_iter', 'capture_iter_chunks',
+    'capture_light', 'capture_many', 'captured', 'drive', 'gather_outcomes',
+    'partition', 'step', 'AlreadyUsedError'
 )
 
 fixup_module_metadata(__name__, globals())
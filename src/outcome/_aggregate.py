@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import sys
+from typing import Iterable, List, Tuple, TypeVar
+
+from ._impl import Error, Outcome, Value, _make_error, _make_value
+
+if sys.version_info < (3, 11):
+    from exceptiongroup import BaseExceptionGroup
+
+__all__ = ['gather_outcomes', 'partition']
+
+ResultT = TypeVar("ResultT")
+
+
+def partition(
+        outcomes: Iterable[Outcome[ResultT]],
+) -> Tuple[List[ResultT], List[BaseException]]:
+    """Use up each of *outcomes*, and split them into values and exceptions.
+
+    This reads the contained values and exceptions directly, so no exception
+    is raised along the way.
+
+    Returns:
+      A ``(values, errors)`` pair: a list of the values from the
+      :class:`Value` objects and a list of the exceptions from the
+      :class:`Error` objects, each in the order they came in.
+
+    Raises:
+      AlreadyUsedError: If one of *outcomes* has already been used. The
+          outcomes before it have been used up by then.
+
+    """
+    values: List[ResultT] = []
+    errors: List[BaseException] = []
+    for outcome in outcomes:
+        outcome._set_unwrapped()
+        if type(outcome) is Value:
+            values.append(outcome._value)
+        else:
+            assert type(outcome) is Error
+            errors.append(outcome.error)
+    return values, errors
+
+
+def gather_outcomes(
+        outcomes: Iterable[Outcome[ResultT]],
+) -> Value[List[ResultT]] | Error:
+    """Use up each of *outcomes*, and combine them into a single outcome.
+
+    Returns:
+      A :class:`Value` holding a list of all the values if every one of
+      *outcomes* is a :class:`Value`. Otherwise, an :class:`Error` holding a
+      :exc:`BaseExceptionGroup` of all the exceptions, in order (which is an
+      :exc:`ExceptionGroup` if they are all :exc:`Exception` subclasses).
+      Unwrapping it raises the group, which ``except*`` can pick apart.
+
+    Raises:
+      AlreadyUsedError: If one of *outcomes* has already been used.
+
+    """
+    values, errors = partition(outcomes)
+    if errors:
+        return _make_error(
+            BaseExceptionGroup("errors in gathered outcomes", errors)
+        )
+    return _make_value(values)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import functools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    TypeVar,
+    overload,
+)
+
+from ._impl import Error, Value, _make_captured_error, _make_value
+
+if TYPE_CHECKING:
+    from typing_extensions import ParamSpec
+    ArgsT = ParamSpec("ArgsT")
+
+__all__ = ['acaptured', 'captured']
+
+ResultT = TypeVar("ResultT")
+
+
+# A coroutine function also matches the second overload, but it's wrapped
+# differently, so this one has to come first.
+@overload
+def captured(  # type: ignore[overload-overlap]
+        sync_fn: Callable[ArgsT, Coroutine[Any, Any, ResultT]],
+) -> Callable[ArgsT, Coroutine[Any, Any, Value[ResultT] | Error]]:
+    ...
+
+
+@overload
+def captured(
+        sync_fn: Callable[ArgsT, ResultT],
+) -> Callable[ArgsT, Value[ResultT] | Error]:
+    ...
+
+
+def captured(sync_fn: Callable[ArgsT, Any]) -> Callable[ArgsT, Any]:
+    """Decorator that makes *sync_fn* return a :class:`Value` or
+    :class:`Error`, as if every call went through :func:`capture`.
+
+    Calling the decorated function is equivalent to calling
+    ``outcome.capture(sync_fn, ...)``, but skips a layer of argument
+    repacking. If *sync_fn* is a coroutine function, this is the same as
+    :func:`acaptured`.
+
+    """
+    # Imported here, since it takes a while and most programs never call this.
+    import inspect
+
+    if inspect.iscoroutinefunction(sync_fn):
+        return acaptured(sync_fn)
+
+    @functools.wraps(sync_fn)
+    def wrapper(
+            *args: ArgsT.args,
+            **kwargs: ArgsT.kwargs,
+    ) -> Value[object] | Error:
+        try:
+            return _make_value(sync_fn(*args, **kwargs))
+        except BaseException as exc:
+            return _make_captured_error(exc)
+
+    return wrapper
+
+
+def acaptured(
+        async_fn: Callable[ArgsT, Awaitable[ResultT]],
+) -> Callable[ArgsT, Coroutine[Any, Any, Value[ResultT] | Error]]:
+    """Decorator that makes *async_fn* return a :class:`Value` or
+    :class:`Error`, as if every call went through :func:`acapture`.
+
+    """
+
+    @functools.wraps(async_fn)
+    async def wrapper(
+            *args: ArgsT.args,
+            **kwargs: ArgsT.kwargs,
+    ) -> Value[ResultT] | Error:
+        try:
+            return _make_value(await async_fn(*args, **kwargs))
+        except BaseException as exc:
+            return _make_captured_error(exc)
+
+    return wrapper
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from typing import (
+    AsyncGenerator,
+    Coroutine,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ._impl import Error, Outcome, Value, _make_captured_error, _make_value
+
+__all__ = ['adrive', 'drive', 'step']
+
+SendT = TypeVar("SendT")
+YieldT = TypeVar("YieldT")
+ReturnT = TypeVar("ReturnT")
+
+
+def step(
+        coro: Union[Generator[YieldT, SendT, ReturnT], Coroutine[YieldT, SendT,
+                                                                 ReturnT]],
+        outcome: Outcome[SendT],
+) -> Tuple[Optional[YieldT], Optional[Value[ReturnT] | Error]]:
+    """Advance a coroutine or generator by one step, by sending or throwing
+    *outcome* into it.
+
+    This is the inner loop of a coroutine scheduler in a single call::
+
+       next_send = outcome.Value(None)
+       while True:
+           yielded, final = outcome.step(coro, next_send)
+           if final is not None:
+               break  # coro has finished
+           next_send = handle(yielded)
+
+    Returns:
+      A ``(yielded, final)`` pair. While *coro* is still running, *yielded*
+      is the value it yielded and *final* is ``None``. Once it has finished,
+      *yielded* is ``None`` and *final* is a :class:`Value` holding its
+      return value, or an :class:`Error` holding the exception it raised.
+
+    Raises:
+      AlreadyUsedError: If *outcome* has already been used.
+
+    """
+    outcome._set_unwrapped()
+    try:
+        if type(outcome) is Value:
+            yielded = coro.send(outcome._value)
+        else:
+            assert type(outcome) is Error
+            yielded = coro.throw(outcome.error)
+    except StopIteration as stop:
+        return None, _make_value(stop.value)
+    except BaseException as exc:
+        return None, _make_captured_error(exc)
+    return yielded, None
+
+
+def drive(
+        gen: Generator[YieldT, SendT, object],
+        outcomes: Iterable[Outcome[SendT]],
+) -> List[Value[YieldT] | Error]:
+    """Send or throw each outcome from *outcomes* into *gen* in turn, and
+    capture what the generator does in response.
+
+    This is equivalent to::
+
+       results = []
+       for o in outcomes:
+           results.append(outcome.capture(o.send, gen))
+           if isinstance(results[-1], outcome.Error):
+               break
+
+    but without the per-step overhead of :func:`capture` and
+    :meth:`~Outcome.send`.
+
+    Each step produces a :class:`Value` holding the next value yielded by
+    *gen*, or an :class:`Error` holding whatever it raised. When the
+    generator finishes, that is the :exc:`StopIteration` carrying its return
+    value. Driving stops after the first :class:`Error`, and any remaining
+    outcomes are left unused.
+
+    Returns:
+      A list with one :class:`Value` or :class:`Error` per step.
+
+    Raises:
+      AlreadyUsedError: If one of *outcomes* has already been used.
+
+    """
+    results: List[Value[YieldT] | Error] = []
+    append = results.append
+    send = gen.send
+    throw = gen.throw
+    for outcome in outcomes:
+        outcome._set_unwrapped()
+        try:
+            if type(outcome) is Value:
+                yielded = send(outcome._value)
+            else:
+                assert type(outcome) is Error
+                yielded = throw(outcome.error)
+        except BaseException as exc:
+            append(_make_captured_error(exc))
+            break
+        append(_make_value(yielded))
+    return results
+
+
+async def adrive(
+        agen: AsyncGenerator[YieldT, SendT],
+        outcomes: Iterable[Outcome[SendT]],
+) -> List[Value[YieldT] | Error]:
+    """Like :func:`drive`, but for async generators.
+
+    When *agen* finishes, the final :class:`Error` holds a
+    :exc:`StopAsyncIteration`.
+
+    Returns:
+      A list with one :class:`Value` or :class:`Error` per step.
+
+    Raises:
+      AlreadyUsedError: If one of *outcomes* has already been used.
+
+    """
+    results: List[Value[YieldT] | Error] = []
+    append = results.append
+    asend = agen.asend
+    athrow = agen.athrow
+    for outcome in outcomes:
+        outcome._set_unwrapped()
+        try:
+            if type(outcome) is Value:
+                yielded = await asend(outcome._value)
+            else:
+                assert type(outcome) is Error
+                yielded = await athrow(outcome.error)
+        except BaseException as exc:
+            append(_make_captured_error(exc))
+            break
+        append(_make_value(yielded))
+    return results
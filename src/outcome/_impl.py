@@ -1,24 +1,34 @@
 from __future__ import annotations
 
 import abc
+import operator
+import sys
 from typing import (
     TYPE_CHECKING,
+    Any,
     AsyncGenerator,
     Awaitable,
     Callable,
+    ClassVar,
     Generator,
     Generic,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
     NoReturn,
+    SupportsIndex,
+    Tuple,
     TypeVar,
     Union,
     overload,
 )
 
-import attr
-
-from ._util import AlreadyUsedError, remove_tb_frames
+from ._util import AlreadyUsedError, _RemoteTraceback, clear_tracebacks
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
     from typing_extensions import ParamSpec, final
     ArgsT = ParamSpec("ArgsT")
 else:
@@ -27,10 +37,27 @@ else:
         return func
 
 
-__all__ = ['Error', 'Outcome', 'Maybe', 'Value', 'acapture', 'capture']
+__all__ = [
+    'CapturedBatch', 'Error', 'Outcome', 'Maybe', 'Value', 'acapture',
+    'capture', 'capture_light', 'capture_many'
+]
 
 ValueT = TypeVar("ValueT", covariant=True)
 ResultT = TypeVar("ResultT")
+DefaultT = TypeVar("DefaultT")
+
+_RELEASED_MESSAGE = (
+    "the contents of this outcome were released when it was unwrapped"
+)
+
+# Outcome.to_bytes() output is a version byte, then a tag byte saying which
+# kind of outcome it is, then the pickled payload. Bump the version if the
+# layout ever changes.
+_WIRE_VERSION = b'\x01'
+_WIRE_VALUE = b'V'
+_WIRE_ERROR = b'E'
+# An Error whose payload is an (exception, formatted traceback) pair.
+_WIRE_ERROR_TB = b'T'
 
 
 @overload
@@ -64,10 +91,96 @@ def capture(
 
     """
     try:
-        return Value(sync_fn(*args, **kwargs))
+        return _make_value(sync_fn(*args, **kwargs))
     except BaseException as exc:
-        exc = remove_tb_frames(exc, 1)
-        return Error(exc)
+        return _make_captured_error(exc)
+
+
+@overload
+def capture_light(
+        sync_fn: Callable[ArgsT, NoReturn],
+        *args: ArgsT.args,
+        **kwargs: ArgsT.kwargs,
+) -> Error:
+    ...
+
+
+@overload
+def capture_light(
+        sync_fn: Callable[ArgsT, ResultT],
+        *args: ArgsT.args,
+        **kwargs: ArgsT.kwargs,
+) -> Value[ResultT] | Error:
+    ...
+
+
+def capture_light(
+        sync_fn: Callable[ArgsT, ResultT],
+        *args: ArgsT.args,
+        **kwargs: ArgsT.kwargs,
+) -> Value[ResultT] | Error:
+    """Like :func:`capture`, but throw away the traceback of any exception.
+
+    This is meant for code that uses exceptions for expected control flow and
+    only cares about the exception object itself. The tracebacks of the
+    exception and of any exceptions chained to it (``__cause__`` and
+    ``__context__``) are cleared before the :class:`Error` is built, so the
+    frames they referenced, and those frames' local variables, are released
+    straight away instead of living as long as the :class:`Error`. If this
+    is called while handling an exception, that exception (which the new
+    one is likely chained to) keeps its traceback.
+
+    Returns:
+      Either a :class:`Value` or :class:`Error` as appropriate.
+
+    """
+    try:
+        return _make_value(sync_fn(*args, **kwargs))
+    except BaseException as exc:
+        error = exc
+    # Out here, sys.exc_info() is back to the exception the caller is
+    # handling, if any.
+    clear_tracebacks(error, sys.exc_info()[1])
+    return _make_error(error)
+
+
+def capture_many(
+        sync_fn: Callable[..., ResultT],
+        args_iter: Iterable[Tuple[Any, ...]],
+) -> CapturedBatch[ResultT]:
+    """Run ``sync_fn(*args)`` for each ``args`` tuple in *args_iter* and
+    capture every result.
+
+    This is like::
+
+       [outcome.capture(sync_fn, *args) for args in args_iter]
+
+    but the results are only stored, and no :class:`Value` or :class:`Error`
+    is built until one is taken out of the returned :class:`CapturedBatch`.
+
+    Returns:
+      A :class:`CapturedBatch` holding the result of each call, in the same
+      order as *args_iter*.
+
+    """
+    payloads: List[Any] = []
+    states = bytearray()
+    append = payloads.append
+    mark = states.append
+    for args in args_iter:
+        try:
+            append(sync_fn(*args))
+            mark(_BATCH_VALUE)
+        except BaseException as exc:
+            append(exc)
+            mark(_BATCH_ERROR)
+    try:
+        return CapturedBatch(payloads, states)
+    finally:
+        # The tracebacks of the captured exceptions reference this frame, so
+        # drop its references to them, to avoid a reference cycle. See
+        # Error.unwrap() for why that matters.
+        del payloads, append
 
 
 @overload
@@ -100,14 +213,20 @@ async def acapture(
 
     """
     try:
-        return Value(await async_fn(*args, **kwargs))
+        return _make_value(await async_fn(*args, **kwargs))
     except BaseException as exc:
-        exc = remove_tb_frames(exc, 1)
-        return Error(exc)
+        return _make_captured_error(exc)
+
+
+def _frozen_setattr(self: object, name: str, value: object) -> NoReturn:
+    raise AttributeError(f"can't set attribute {name!r} of {self!r}")
+
+
+def _frozen_delattr(self: object, name: str) -> NoReturn:
+    raise AttributeError(f"can't delete attribute {name!r} of {self!r}")
 
 
-@attr.s(repr=False, init=False, slots=True)
-class Outcome(abc.ABC, Generic[ValueT]):
+class Outcome(Generic[ValueT]):
     """An abstract class representing the result of a Python computation.
 
     This class has two concrete subclasses: :class:`Value` representing a
@@ -122,15 +241,49 @@ class Outcome(abc.ABC, Generic[ValueT]):
     hashable.
 
     """
-    _unwrapped: bool = attr.ib(default=False, eq=False, init=False)
+    __slots__ = ('_unused', '_created_at', '__weakref__')
+
+    # Set when the outcome is created, and deleted when it's used. Deleting a
+    # slot that is already empty fails, and CPython does the check and the
+    # delete as one step (under a per-object lock on free-threaded builds),
+    # so two threads can never both succeed in using the same outcome. This
+    # is also cheaper than a separate check and set.
+    _unused: bool
+    # Only filled in while outcome.instrument is enabled.
+    _created_at: float
+
+    # Outcome isn't an abc.ABC, since ABCMeta makes isinstance() checks
+    # against Value and Error several times slower, and Trio makes a lot of
+    # them. Instead, __abstractmethods__ is filled in by hand (see below the
+    # class), which is all object.__new__() looks at to refuse to instantiate
+    # an abstract class.
+    __abstractmethods__: ClassVar[frozenset[str]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.__abstractmethods__ = frozenset(
+            name for name in Outcome.__abstractmethods__
+            if getattr(getattr(cls, name), '__isabstractmethod__', False)
+        )
+
+    #: ``True`` for :class:`Value` objects, ``False`` for :class:`Error`
+    #: objects. These are plain class attributes, so checking them is cheaper
+    #: than an :func:`isinstance` check, and type checkers narrow
+    #: :data:`Maybe` on them just the same.
+    is_value: ClassVar[bool]
+    #: The opposite of :attr:`is_value`.
+    is_error: ClassVar[bool]
 
     def _set_unwrapped(self) -> None:
-        if self._unwrapped:
-            raise AlreadyUsedError
-        object.__setattr__(self, '_unwrapped', True)
+        try:
+            _clear_unused(self)
+        except AttributeError:
+            raise _already_used(self) from None
+        if _observers:
+            _notify_used(self)
 
     @abc.abstractmethod
-    def unwrap(self) -> ValueT:
+    def unwrap(self, *, release: bool = False) -> ValueT:
         """Return or raise the contained value or exception.
 
         These two lines of code are equivalent::
@@ -138,77 +291,409 @@ class Outcome(abc.ABC, Generic[ValueT]):
            x = fn(*args)
            x = outcome.capture(fn, *args).unwrap()
 
+        Args:
+          release: If true, the outcome drops its reference to the contained
+              value or exception, so that it doesn't keep it alive for as
+              long as the outcome itself is kept around. Accessing
+              :attr:`Value.value` or :attr:`Error.error` afterwards raises
+              :exc:`AlreadyUsedError`, and so does comparing or hashing the
+              outcome, since those go by its contents. So don't release an
+              outcome that is a dict key or in a set; key such bookkeeping
+              by something else, like ``id(outcome)``.
+
         """
 
     @abc.abstractmethod
-    def send(self, gen: Generator[ResultT, ValueT, object]) -> ResultT:
+    def send(
+            self,
+            gen: Generator[ResultT, ValueT, object],
+            *,
+            release: bool = False,
+    ) -> ResultT:
         """Send or throw the contained value or exception into the given
         generator object.
 
         Args:
           gen: A generator object supporting ``.send()`` and ``.throw()``
               methods.
+          release: As for :meth:`unwrap`.
 
         """
 
     @abc.abstractmethod
-    async def asend(self, agen: AsyncGenerator[ResultT, ValueT]) -> ResultT:
+    async def asend(
+            self,
+            agen: AsyncGenerator[ResultT, ValueT],
+            *,
+            release: bool = False,
+    ) -> ResultT:
         """Send or throw the contained value or exception into the given async
         generator object.
 
         Args:
           agen: An async generator object supporting ``.asend()`` and
               ``.athrow()`` methods.
+          release: As for :meth:`unwrap`.
+
+        """
+
+    @abc.abstractmethod
+    def map(
+            self,
+            fn: Callable[[ValueT], ResultT],
+    ) -> Value[ResultT] | Error:
+        """Use this outcome, and return a new one holding the result of
+        calling *fn* on the contained value.
+
+        On a :class:`Value`, this is ``capture(fn, value)``. On an
+        :class:`Error`, *fn* isn't called and a new :class:`Error` holding the
+        same exception is returned, without raising and catching it again.
 
         """
 
+    @abc.abstractmethod
+    def map_error(
+            self,
+            fn: Callable[[BaseException], BaseException],
+    ) -> Value[ValueT] | Error:
+        """Use this outcome, and return a new one where the contained
+        exception is replaced by the one *fn* returns.
+
+        On an :class:`Error`, *fn* is called with the exception and must
+        return an exception, which the new :class:`Error` holds. If *fn*
+        raises, the new :class:`Error` holds that exception instead, and if
+        it returns something else, a :exc:`TypeError` caused by the original
+        exception, so that isn't lost. On a :class:`Value`, *fn* isn't called
+        and a new :class:`Value` holding the same value is returned.
+
+        """
+
+    @abc.abstractmethod
+    def and_then(
+            self,
+            fn: Callable[[ValueT], Value[ResultT] | Error],
+    ) -> Value[ResultT] | Error:
+        """Like :meth:`map`, but for a *fn* that returns an outcome itself,
+        which is returned as is rather than wrapped in another
+        :class:`Value`. If *fn* returns something else, the new outcome is an
+        :class:`Error` holding a :exc:`TypeError`.
+
+        """
+
+    @abc.abstractmethod
+    def unwrap_or(self, default: DefaultT) -> ValueT | DefaultT:
+        """Use this outcome, and return the contained value, or *default* if
+        it is an :class:`Error`. The exception is discarded.
+
+        """
+
+    @abc.abstractmethod
+    def to_bytes(self, *, keep_traceback: bool = False) -> bytes:
+        """Serialize the contained value or exception to bytes, which can be
+        turned back into an outcome with :meth:`Outcome.from_bytes`.
+
+        This does not count as using the outcome. The payload is pickled, so
+        it must be picklable, and :meth:`from_bytes` must only be used on
+        trusted data.
+
+        Args:
+          keep_traceback: Tracebacks can't be pickled, so they are normally
+              dropped. If this is true, the traceback of an :class:`Error` is
+              formatted as text and attached to the exception rebuilt by
+              :meth:`from_bytes` as its ``__cause__``.
+
+        """
+
+    @staticmethod
+    def from_bytes(data: bytes) -> Value[object] | Error:
+        """Rebuild an outcome from bytes produced by :meth:`to_bytes`.
+
+        Raises:
+          ValueError: If *data* wasn't produced by :meth:`to_bytes`.
+
+        """
+        import pickle
+
+        if data[:1] != _WIRE_VERSION:
+            raise ValueError("unsupported outcome serialization format")
+        tag = data[1:2]
+        if tag not in (_WIRE_VALUE, _WIRE_ERROR, _WIRE_ERROR_TB):
+            raise ValueError(f"unknown outcome tag {tag!r}")
+        payload = pickle.loads(memoryview(data)[2:])
+        if tag == _WIRE_VALUE:
+            return Value(payload)
+        if tag == _WIRE_ERROR:
+            return Error(payload)
+        exc, tb_text = payload
+        exc.__cause__ = _RemoteTraceback(tb_text)
+        return Error(exc)
+
+
+Outcome.__abstractmethods__ = frozenset(
+    name for name, attr in vars(Outcome).items()
+    if getattr(attr, '__isabstractmethod__', False)
+)
+
 
 @final
-@attr.s(frozen=True, repr=False, slots=True)
 class Value(Outcome[ValueT], Generic[ValueT]):
     """Concrete :class:`Outcome` subclass representing a regular value.
 
     """
+    __slots__ = ('_value',)
+    __match_args__ = ('value',)
+    is_value: ClassVar[Literal[True]] = True
+    is_error: ClassVar[Literal[False]] = False
+
+    _value: ValueT
+
+    def __init__(self, value: ValueT) -> None:
+        _store_unused(self, True)
+        _store_value(self, value)
+        if _hooked:
+            _notify_created(self)
+
+    __setattr__ = _frozen_setattr
+    __delattr__ = _frozen_delattr
 
-    value: ValueT = attr.ib()
-    """The contained value."""
+    @property
+    def value(self) -> ValueT:
+        """The contained value."""
+        try:
+            return self._value
+        except AttributeError:
+            raise AlreadyUsedError(_RELEASED_MESSAGE) from None
 
     def __repr__(self) -> str:
-        return f'Value({self.value!r})'
+        try:
+            return f'Value({self._value!r})'
+        except AttributeError:
+            return 'Value(<released>)'
+
+    # Comparisons go through 1-tuples so that they behave exactly like
+    # comparing the contained values inside a container, e.g. a value is
+    # always equal to itself even if it's a NaN.
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not Value:
+            return NotImplemented
+        return (self.value,) == (other.value,)
+
+    def __lt__(self, other: object) -> bool:
+        if type(other) is not Value:
+            return NotImplemented
+        return (self.value,) < (other.value,)
+
+    def __le__(self, other: object) -> bool:
+        if type(other) is not Value:
+            return NotImplemented
+        return (self.value,) <= (other.value,)
+
+    def __gt__(self, other: object) -> bool:
+        if type(other) is not Value:
+            return NotImplemented
+        return (self.value,) > (other.value,)
 
-    def unwrap(self) -> ValueT:
+    def __ge__(self, other: object) -> bool:
+        if type(other) is not Value:
+            return NotImplemented
+        return (self.value,) >= (other.value,)
+
+    def __hash__(self) -> int:
+        return hash((Value, self.value))
+
+    def unwrap(self, *, release: bool = False) -> ValueT:
+        self._set_unwrapped()
+        value = self._value
+        if release:
+            _clear_value(self)
+        return value
+
+    def send(
+            self,
+            gen: Generator[ResultT, ValueT, object],
+            *,
+            release: bool = False,
+    ) -> ResultT:
         self._set_unwrapped()
-        return self.value
+        value = self._value
+        if release:
+            _clear_value(self)
+        return gen.send(value)
 
-    def send(self, gen: Generator[ResultT, ValueT, object]) -> ResultT:
+    async def asend(
+            self,
+            agen: AsyncGenerator[ResultT, ValueT],
+            *,
+            release: bool = False,
+    ) -> ResultT:
         self._set_unwrapped()
-        return gen.send(self.value)
+        value = self._value
+        if release:
+            _clear_value(self)
+        return await agen.asend(value)
+
+    def map(
+            self,
+            fn: Callable[[ValueT], ResultT],
+    ) -> Value[ResultT] | Error:
+        self._set_unwrapped()
+        try:
+            return _make_value(fn(self._value))
+        except BaseException as exc:
+            return _make_captured_error(exc)
 
-    async def asend(self, agen: AsyncGenerator[ResultT, ValueT]) -> ResultT:
+    def map_error(
+            self,
+            fn: Callable[[BaseException], BaseException],
+    ) -> Value[ValueT]:
         self._set_unwrapped()
-        return await agen.asend(self.value)
+        return _make_value(self._value)
+
+    def and_then(
+            self,
+            fn: Callable[[ValueT], Value[ResultT] | Error],
+    ) -> Value[ResultT] | Error:
+        self._set_unwrapped()
+        try:
+            result = fn(self._value)
+            if type(result) is not Value and type(result) is not Error:
+                raise TypeError(
+                    f"and_then() callback must return an outcome, "
+                    f"not {result!r}"
+                )
+        except BaseException as exc:
+            return _make_captured_error(exc)
+        return result
+
+    def unwrap_or(self, default: object) -> ValueT:
+        self._set_unwrapped()
+        return self._value
+
+    def reset(self) -> None:
+        """Make this :class:`Value` usable again after it has been used.
+
+        This lets code that keeps sending the same immutable value, like a
+        scheduler resuming tasks with ``Value(None)``, reuse one object
+        instead of allocating a fresh one every time. It undoes the
+        single-use protection, so it's only safe when nothing else holds a
+        reference to this outcome that it might still use.
+
+        Raises:
+          AlreadyUsedError: If the value was released when it was used, with
+              ``release=True``.
+
+        """
+        try:
+            self._value
+        except AttributeError:
+            raise AlreadyUsedError(_RELEASED_MESSAGE) from None
+        _store_unused(self, True)
+
+    def to_bytes(self, *, keep_traceback: bool = False) -> bytes:
+        import pickle
+
+        return _WIRE_VERSION + _WIRE_VALUE + pickle.dumps(
+            self.value, pickle.HIGHEST_PROTOCOL
+        )
+
+    def __reduce__(self) -> tuple[type[Value[ValueT]], tuple[ValueT]]:
+        # Copies start out unused, whatever the state of the original.
+        return Value, (self.value,)
 
 
 @final
-@attr.s(frozen=True, repr=False, slots=True)
 class Error(Outcome[NoReturn]):
     """Concrete :class:`Outcome` subclass representing a raised exception.
 
     """
+    __slots__ = ('_error', '_untrimmed_tb')
+    __match_args__ = ('error',)
+    is_value: ClassVar[Literal[False]] = False
+    is_error: ClassVar[Literal[True]] = True
+
+    _error: BaseException
+    # When captured, the exception's traceback starts with the frame of the
+    # capturing function, which we don't want to show. Removing it is
+    # deferred until the exception is actually looked at, since many errors
+    # are only checked for their type and then dropped.
+    _untrimmed_tb: TracebackType | None
+
+    def __init__(self, error: BaseException) -> None:
+        if not isinstance(error, BaseException):
+            raise TypeError(
+                f"'error' must be an exception instance, not {error!r}"
+            )
+        _store_unused(self, True)
+        _store_error(self, error)
+        _store_untrimmed_tb(self, None)
+        if _hooked:
+            _notify_created(self)
+
+    __setattr__ = _frozen_setattr
+    __delattr__ = _frozen_delattr
+
+    def _peek(self) -> BaseException:
+        """Return the contained exception, leaving its traceback untrimmed,
+        for comparing and hashing."""
+        try:
+            return self._error
+        except AttributeError:
+            raise AlreadyUsedError(_RELEASED_MESSAGE) from None
 
-    error: BaseException = attr.ib(
-        validator=attr.validators.instance_of(BaseException)
-    )
-    """The contained exception object."""
+    @property
+    def error(self) -> BaseException:
+        """The contained exception object."""
+        error = self._peek()
+        tb = self._untrimmed_tb
+        if tb is not None:
+            _store_untrimmed_tb(self, None)
+            # Leave the traceback alone if the exception has been raised
+            # again since it was captured.
+            if error.__traceback__ is tb:
+                error.__traceback__ = tb.tb_next
+        return error
 
     def __repr__(self) -> str:
-        return f'Error({self.error!r})'
+        try:
+            return f'Error({self._error!r})'
+        except AttributeError:
+            return 'Error(<released>)'
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not Error:
+            return NotImplemented
+        return (self._peek(),) == (other._peek(),)
+
+    def __lt__(self, other: object) -> bool:
+        if type(other) is not Error:
+            return NotImplemented
+        return (self._peek(),) < (other._peek(),)
+
+    def __le__(self, other: object) -> bool:
+        if type(other) is not Error:
+            return NotImplemented
+        return (self._peek(),) <= (other._peek(),)
+
+    def __gt__(self, other: object) -> bool:
+        if type(other) is not Error:
+            return NotImplemented
+        return (self._peek(),) > (other._peek(),)
+
+    def __ge__(self, other: object) -> bool:
+        if type(other) is not Error:
+            return NotImplemented
+        return (self._peek(),) >= (other._peek(),)
+
+    def __hash__(self) -> int:
+        return hash((Error, self._peek()))
 
-    def unwrap(self) -> NoReturn:
+    def unwrap(self, *, release: bool = False) -> NoReturn:
         self._set_unwrapped()
         # Tracebacks show the 'raise' line below out of context, so let's give
         # this variable a name that makes sense out of context.
         captured_error = self.error
+        if release:
+            _clear_error(self)
         try:
             raise captured_error
         finally:
@@ -224,15 +709,317 @@ class Error(Outcome[NoReturn]):
             # In particuar, by deleting this local variables from the 'unwrap'
             # methods frame, we avoid the 'captured_error' object's
             # __traceback__ from indirectly referencing 'captured_error'.
-            del captured_error, self
+            del captured_error, self, release
+
+    def send(
+            self,
+            gen: Generator[ResultT, NoReturn, object],
+            *,
+            release: bool = False,
+    ) -> ResultT:
+        self._set_unwrapped()
+        error = self.error
+        if release:
+            _clear_error(self)
+        return gen.throw(error)
+
+    async def asend(
+            self,
+            agen: AsyncGenerator[ResultT, NoReturn],
+            *,
+            release: bool = False,
+    ) -> ResultT:
+        self._set_unwrapped()
+        error = self.error
+        if release:
+            _clear_error(self)
+        return await agen.athrow(error)
+
+    def _forward(self) -> Error:
+        """Use this outcome, and return a new one holding the same exception.
+
+        The traceback is left as it is, so if it hasn't been trimmed yet, the
+        new Error takes that over.
+        """
+        self._set_unwrapped()
+        return _make_shared_error(self._error, self._untrimmed_tb)
 
-    def send(self, gen: Generator[ResultT, NoReturn, object]) -> ResultT:
+    def map(self, fn: Callable[[NoReturn], object]) -> Error:
+        return self._forward()
+
+    def map_error(
+            self,
+            fn: Callable[[BaseException], BaseException],
+    ) -> Error:
         self._set_unwrapped()
-        return gen.throw(self.error)
+        try:
+            error = self.error
+            new_error = fn(error)
+            if not isinstance(new_error, BaseException):
+                raise TypeError(
+                    f"map_error() callback must return an exception, "
+                    f"not {new_error!r}"
+                ) from error
+        except BaseException as exc:
+            return _make_captured_error(exc)
+        return _make_error(new_error)
 
-    async def asend(self, agen: AsyncGenerator[ResultT, NoReturn]) -> ResultT:
+    def and_then(self, fn: Callable[[NoReturn], object]) -> Error:
+        return self._forward()
+
+    def unwrap_or(self, default: DefaultT) -> DefaultT:
         self._set_unwrapped()
-        return await agen.athrow(self.error)
+        return default
+
+    def to_bytes(self, *, keep_traceback: bool = False) -> bytes:
+        import pickle
+
+        exc = self.error
+        if keep_traceback and exc.__traceback__ is not None:
+            import traceback
+
+            tb_text = ''.join(
+                traceback.format_exception(type(exc), exc, exc.__traceback__)
+            )
+            return _WIRE_VERSION + _WIRE_ERROR_TB + pickle.dumps(
+                (exc, tb_text), pickle.HIGHEST_PROTOCOL
+            )
+        return _WIRE_VERSION + _WIRE_ERROR + pickle.dumps(
+            exc, pickle.HIGHEST_PROTOCOL
+        )
+
+    def __reduce__(self) -> tuple[type[Error], tuple[BaseException]]:
+        # Copies start out unused, whatever the state of the original.
+        return Error, (self.error,)
+
+
+# The state of each item of a CapturedBatch. Taking an item out sets the
+# taken bit, and keeps the error bit so that is_error() still works.
+_BATCH_VALUE = 0
+_BATCH_ERROR = 1
+_BATCH_TAKEN = 2
+
+
+@final
+class CapturedBatch(Generic[ValueT]):
+    """The results of the calls made by :func:`capture_many`.
+
+    The results are stored as they are, in one list alongside an array of
+    flags saying which were raised, rather than as a :class:`Value` or
+    :class:`Error` each. An outcome is only built when an item is taken out,
+    by indexing or by iterating. Like an outcome, each item can only be
+    taken once; taking it again raises :exc:`AlreadyUsedError`.
+
+    This isn't meant to be created directly.
+
+    """
+
+    __slots__ = ('_payloads', '_states')
+
+    _payloads: List[Any]
+    _states: bytearray
+
+    def __init__(self, payloads: List[Any], states: bytearray) -> None:
+        self._payloads = payloads
+        self._states = states
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __getitem__(self, index: SupportsIndex) -> Value[ValueT] | Error:
+        """Take out the outcome of one call.
+
+        Raises:
+          AlreadyUsedError: If this item has already been taken out.
+
+        """
+        index = operator.index(index)
+        states = self._states
+        state = states[index]
+        if state & _BATCH_TAKEN:
+            raise AlreadyUsedError
+        states[index] = state | _BATCH_TAKEN
+        payloads = self._payloads
+        payload = payloads[index]
+        # Taking an item out hands over the batch's reference to it.
+        payloads[index] = None
+        if state == _BATCH_VALUE:
+            return _make_value(payload)
+        return _make_captured_error(payload)
+
+    def __iter__(self) -> Iterator[Value[ValueT] | Error]:
+        """Take out the outcome of each call in turn."""
+        for index in range(len(self._states)):
+            yield self[index]
+
+    def is_error(self, index: SupportsIndex) -> bool:
+        """Return whether the call at *index* raised, without taking its
+        outcome out. This works whether or not it has been taken."""
+        return bool(self._states[operator.index(index)] & _BATCH_ERROR)
+
+
+# Observers are told about outcomes being created and used. This is how
+# outcome.instrument hooks in. It's an empty tuple unless something is
+# installed, so that the hot paths only pay for a single global check.
+_observers: Tuple[_Observer, ...] = ()
+
+# Sampling of created outcomes, for outcome.instrument.enable_sampling().
+# The countdown is kept here rather than in an observer, so that the
+# outcomes that aren't sampled only cost a decrement, and instrument is only
+# called for the ones that are. A countdown of 0 means sampling is off.
+_sample: Callable[[Value[object] | Error], None] | None = None
+_sample_every = 0
+_sample_countdown = 0
+
+# Whether there are any observers or sampling is on, so that creating an
+# outcome still only costs a single global check when neither is.
+_hooked = False
+
+
+class _Observer:
+    """Base class for objects that can be passed to _add_observer()."""
+
+    def created(self, outcome: Value[object] | Error) -> None:
+        pass
+
+    def used(self, outcome: Outcome[object]) -> None:
+        pass
+
+    def used_again(self, outcome: Outcome[object]) -> None:
+        pass
+
+
+def _add_observer(observer: _Observer) -> None:
+    global _observers, _hooked
+    _observers += (observer,)
+    _hooked = True
+
+
+def _remove_observer(observer: _Observer) -> None:
+    global _observers, _hooked
+    _observers = tuple(o for o in _observers if o is not observer)
+    _hooked = bool(_observers) or _sample is not None
+
+
+def _set_sampler(
+        sample: Callable[[Value[object] | Error], None] | None,
+        every: int = 0,
+) -> None:
+    """Call *sample* with one in every *every* outcomes created, or stop
+    sampling if *sample* is None."""
+    global _sample, _sample_every, _sample_countdown, _hooked
+    _sample = sample
+    _sample_every = _sample_countdown = every
+    _hooked = bool(_observers) or _sample is not None
+
+
+def _take_sample(outcome: Value[object] | Error) -> None:
+    global _sample_countdown
+    _sample_countdown = _sample_every
+    assert _sample is not None
+    _sample(outcome)
+
+
+# _make_value() and _make_captured_error() inline this, so that sampling
+# doesn't add a call to every capture().
+def _notify_created(outcome: Value[object] | Error) -> None:
+    global _sample_countdown
+    if _sample_countdown:
+        _sample_countdown -= 1
+        if not _sample_countdown:
+            _take_sample(outcome)
+    for observer in _observers:
+        observer.created(outcome)
+
+
+def _notify_used(outcome: Outcome[object]) -> None:
+    for observer in _observers:
+        observer.used(outcome)
+
+
+def _already_used(outcome: Outcome[object]) -> AlreadyUsedError:
+    for observer in _observers:
+        observer.used_again(outcome)
+    return AlreadyUsedError()
+
+
+# Setters for the slots, which bypass the frozen __setattr__.
+_store_unused = Outcome.__dict__['_unused'].__set__
+_clear_unused = Outcome.__dict__['_unused'].__delete__
+_store_created_at = Outcome.__dict__['_created_at'].__set__
+_store_value = Value.__dict__['_value'].__set__
+_clear_value = Value.__dict__['_value'].__delete__
+_store_error = Error.__dict__['_error'].__set__
+_store_untrimmed_tb = Error.__dict__['_untrimmed_tb'].__set__
+_clear_error = Error.__dict__['_error'].__delete__
+
+# Trusted constructors, for use inside this package where the argument is
+# already known to be valid. They skip __init__ (and the Error type check)
+# and fill in the slots directly, which is noticeably cheaper on the
+# capture() hot path.
+_new_outcome = object.__new__
+
+
+def _make_value(value: ResultT) -> Value[ResultT]:
+    global _sample_countdown
+    self: Value[ResultT] = _new_outcome(Value)
+    _store_unused(self, True)
+    _store_value(self, value)
+    if _hooked:
+        # _notify_created(), inlined.
+        if _sample_countdown:
+            _sample_countdown -= 1
+            if not _sample_countdown:
+                _take_sample(self)
+        for observer in _observers:
+            observer.created(self)
+    return self
+
+
+def _make_error(exc: BaseException) -> Error:
+    self = _new_outcome(Error)
+    _store_unused(self, True)
+    _store_error(self, exc)
+    _store_untrimmed_tb(self, None)
+    if _hooked:
+        _notify_created(self)
+    return self
+
+
+def _make_captured_error(exc: BaseException) -> Error:
+    """Like _make_error(), for an exception that was just caught by the
+    calling function, whose frame will be hidden from the traceback."""
+    global _sample_countdown
+    self = _new_outcome(Error)
+    _store_unused(self, True)
+    _store_error(self, exc)
+    _store_untrimmed_tb(self, exc.__traceback__)
+    if _hooked:
+        # _notify_created(), inlined.
+        if _sample_countdown:
+            _sample_countdown -= 1
+            if not _sample_countdown:
+                _take_sample(self)
+        for observer in _observers:
+            observer.created(self)
+    return self
+
+
+def _make_shared_error(
+        exc: BaseException,
+        untrimmed_tb: TracebackType | None,
+) -> Error:
+    """Like _make_captured_error(), for an exception that is (or may be) held
+    by other Errors too. *untrimmed_tb* is the traceback it was captured
+    with, if that hasn't been trimmed yet. Whichever Error is looked at first
+    trims it, and the rest see that it has already been done."""
+    self = _new_outcome(Error)
+    _store_unused(self, True)
+    _store_error(self, exc)
+    _store_untrimmed_tb(self, untrimmed_tb)
+    if _hooked:
+        _notify_created(self)
+    return self
 
 
 # A convenience alias to a union of both results, allowing exhaustiveness checking.
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    TypeVar,
+)
+
+from ._impl import Error, Value, _make_captured_error, _make_value
+
+__all__ = [
+    'acapture_iter', 'acapture_iter_chunks', 'capture_iter',
+    'capture_iter_chunks'
+]
+
+ItemT = TypeVar("ItemT")
+
+
+def _check_size(size: int) -> None:
+    if size < 1:
+        raise ValueError(f"size must be at least 1, not {size!r}")
+
+
+def capture_iter(iterable: Iterable[ItemT]) -> Iterator[Value[ItemT] | Error]:
+    """Iterate over *iterable*, capturing each step.
+
+    This lazily yields a :class:`Value` for each item. If getting an item
+    raises an exception, an :class:`Error` holding it is yielded and the
+    iteration stops there, so the consumer can handle the failure without
+    losing the items that came before it. Only one item is held at a time.
+
+    Only exceptions raised by *iterable* itself are captured; an exception
+    thrown into the returned generator (like :exc:`GeneratorExit` when it is
+    closed) passes straight through.
+
+    """
+    try:
+        next_item = iter(iterable).__next__
+    except BaseException as exc:
+        yield _make_captured_error(exc)
+        return
+    while True:
+        try:
+            item = next_item()
+        except StopIteration:
+            return
+        except BaseException as exc:
+            yield _make_captured_error(exc)
+            return
+        yield _make_value(item)
+
+
+def capture_iter_chunks(
+        iterable: Iterable[ItemT],
+        size: int,
+) -> Iterator[List[Value[ItemT] | Error]]:
+    """Like :func:`capture_iter`, but yield lists of up to *size* outcomes at
+    a time, which is cheaper than yielding them one by one.
+
+    Every list except the last one holds exactly *size* outcomes. An
+    :class:`Error` can only be the last outcome of the last list.
+
+    Raises:
+      ValueError: If *size* is less than 1. This is raised by the call
+          itself, not when iteration starts.
+
+    """
+    _check_size(size)
+    return _capture_iter_chunks(iterable, size)
+
+
+def _capture_iter_chunks(
+        iterable: Iterable[ItemT],
+        size: int,
+) -> Iterator[List[Value[ItemT] | Error]]:
+    try:
+        next_item = iter(iterable).__next__
+    except BaseException as exc:
+        yield [_make_captured_error(exc)]
+        return
+    while True:
+        chunk: List[Value[ItemT] | Error] = []
+        append = chunk.append
+        for _ in range(size):
+            try:
+                item = next_item()
+            except StopIteration:
+                if chunk:
+                    yield chunk
+                return
+            except BaseException as exc:
+                append(_make_captured_error(exc))
+                yield chunk
+                return
+            append(_make_value(item))
+        yield chunk
+
+
+async def acapture_iter(
+        aiterable: AsyncIterable[ItemT],
+) -> AsyncIterator[Value[ItemT] | Error]:
+    """Like :func:`capture_iter`, but for async iterables."""
+    try:
+        anext_item = aiterable.__aiter__().__anext__
+    except BaseException as exc:
+        yield _make_captured_error(exc)
+        return
+    while True:
+        try:
+            item = await anext_item()
+        except StopAsyncIteration:
+            return
+        except BaseException as exc:
+            yield _make_captured_error(exc)
+            return
+        yield _make_value(item)
+
+
+def acapture_iter_chunks(
+        aiterable: AsyncIterable[ItemT],
+        size: int,
+) -> AsyncIterator[List[Value[ItemT] | Error]]:
+    """Like :func:`capture_iter_chunks`, but for async iterables."""
+    _check_size(size)
+    return _acapture_iter_chunks(aiterable, size)
+
+
+async def _acapture_iter_chunks(
+        aiterable: AsyncIterable[ItemT],
+        size: int,
+) -> AsyncIterator[List[Value[ItemT] | Error]]:
+    try:
+        anext_item = aiterable.__aiter__().__anext__
+    except BaseException as exc:
+        yield [_make_captured_error(exc)]
+        return
+    while True:
+        chunk: List[Value[ItemT] | Error] = []
+        append = chunk.append
+        for _ in range(size):
+            try:
+                item = await anext_item()
+            except StopAsyncIteration:
+                if chunk:
+                    yield chunk
+                return
+            except BaseException as exc:
+                append(_make_captured_error(exc))
+                yield chunk
+                return
+            append(_make_value(item))
+        yield chunk
@@ -1,4 +1,14 @@
-from typing import Any, Dict
+import sys
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+if sys.version_info < (3, 11):
+    from exceptiongroup import BaseExceptionGroup
+
+
+def _subexceptions(exc: BaseException) -> Sequence[BaseException]:
+    if isinstance(exc, BaseExceptionGroup):
+        return exc.exceptions
+    return ()
 
 
 class AlreadyUsedError(RuntimeError):
@@ -6,6 +16,17 @@ class AlreadyUsedError(RuntimeError):
     pass
 
 
+class _RemoteTraceback(Exception):
+    """Attached as the ``__cause__`` of exceptions rebuilt by
+    ``Outcome.from_bytes()``, to show their original traceback."""
+
+    def __init__(self, tb: str) -> None:
+        self.tb = tb
+
+    def __str__(self) -> str:
+        return self.tb
+
+
 def fixup_module_metadata(
         module_name: str,
         namespace: Dict[str, object],
@@ -25,9 +46,61 @@ def fixup_module_metadata(
         fix_one(obj)
 
 
-def remove_tb_frames(exc: BaseException, n: int) -> BaseException:
-    tb = exc.__traceback__
-    for _ in range(n):
-        assert tb is not None
-        tb = tb.tb_next
-    return exc.with_traceback(tb)
+def clear_tracebacks(
+        exc: BaseException,
+        handling: Optional[BaseException] = None,
+) -> None:
+    """Drop the traceback of *exc* and of every exception chained to it, so
+    that the frames they reference (and those frames' locals) can be freed.
+
+    *handling* is the exception the caller is handling, if any, which *exc*
+    is likely chained to. It and the exceptions it was raised while handling
+    are still in use, so the walk stops at them and leaves them alone.
+
+    """
+    seen: Set[int] = set()
+    while handling is not None and id(handling) not in seen:
+        seen.add(id(handling))
+        handling = handling.__context__
+    todo: List[BaseException] = [exc]
+    while todo:
+        exc = todo.pop()
+        if id(exc) in seen:
+            continue
+        seen.add(id(exc))
+        exc.__traceback__ = None
+        if exc.__cause__ is not None:
+            todo.append(exc.__cause__)
+        if exc.__context__ is not None:
+            todo.append(exc.__context__)
+        todo.extend(_subexceptions(exc))
+
+
+def _assume_asyncio() -> str:
+    return "asyncio"
+
+
+# What current_async_library() defers to. It's looked up on the first call
+# rather than at import, so that importing outcome doesn't import sniffio,
+# and then kept, so that a missing sniffio isn't searched for on every call.
+_detect_async_library: Optional[Callable[[], str]] = None
+
+
+def current_async_library() -> str:
+    """Return the name of the async library that is running, which is
+    ``"trio"`` or ``"asyncio"``.
+
+    This defers to `sniffio <https://sniffio.readthedocs.io/>`__ when it is
+    installed, which it always is alongside Trio, and assumes asyncio
+    otherwise.
+
+    """
+    global _detect_async_library
+    if _detect_async_library is None:
+        try:
+            import sniffio
+        except ImportError:
+            _detect_async_library = _assume_asyncio
+        else:
+            _detect_async_library = sniffio.current_async_library
+    return _detect_async_library()
@@ -0,0 +1,362 @@
+"""Memoization that caches outcomes, including failures.
+
+:func:`memoize` caches the result of each call like
+:func:`functools.lru_cache`, but the decorated function returns a
+:class:`~outcome.Value` or :class:`~outcome.Error` instead of returning or
+raising, and exceptions can be cached too (negative caching), with their own
+time to live.
+
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from collections import OrderedDict
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from ._impl import Error, Value, _make_error, _make_value
+from ._util import current_async_library
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Protocol
+
+    from typing_extensions import ParamSpec
+    ArgsT = ParamSpec("ArgsT")
+    ResultT = TypeVar("ResultT")
+    CallResultT = TypeVar("CallResultT", covariant=True)
+    AsyncMaybe = Coroutine[Any, Any, Union[Value[ResultT], Error]]
+
+    class MemoizedFunction(Protocol[ArgsT, CallResultT]):
+        def __call__(
+                self,
+                *args: ArgsT.args,
+                **kwargs: ArgsT.kwargs,
+        ) -> CallResultT:
+            ...
+
+        def cache_info(self) -> CacheInfo:
+            ...
+
+        def cache_clear(self) -> None:
+            ...
+
+    class Memoizer(Protocol):
+        # A coroutine function also matches the second overload, but it's
+        # wrapped differently, so this one has to come first.
+        @overload
+        def __call__(  # type: ignore[overload-overlap]
+                self,
+                fn: Callable[ArgsT, Coroutine[Any, Any, ResultT]],
+        ) -> MemoizedFunction[ArgsT, AsyncMaybe[ResultT]]:
+            ...
+
+        @overload
+        def __call__(
+                self,
+                fn: Callable[ArgsT, ResultT],
+        ) -> MemoizedFunction[ArgsT, Value[ResultT] | Error]:
+            ...
+
+
+__all__ = ['CacheInfo', 'memoize']
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for a function decorated with :func:`memoize`, as returned
+    by its ``cache_info()`` method."""
+
+    #: Calls answered from the cache.
+    hits: int
+    #: Calls that ran the function.
+    misses: int
+    #: Async calls that waited for a call with the same arguments that was
+    #: already running, and shared its result, instead of running the
+    #: function again.
+    coalesced: int
+    #: The *maxsize* passed to :func:`memoize`.
+    maxsize: Optional[int]
+    #: How many results are cached right now, including any that have
+    #: expired but haven't been looked up since.
+    currsize: int
+
+
+class _Result:
+    """A cached result. Unlike an outcome, this can be used any number of
+    times, and is turned into a fresh outcome each time."""
+
+    __slots__ = ('payload', 'is_error', 'tb', 'expires')
+
+    def __init__(
+            self,
+            payload: Any,
+            is_error: bool,
+            tb: TracebackType | None,
+    ) -> None:
+        self.payload = payload
+        self.is_error = is_error
+        # The traceback of an exception as it was captured, which it's reset
+        # to on every hit, since unwrapping the previous outcome will have
+        # raised it and so added more frames.
+        self.tb = tb
+        self.expires: Optional[float] = None
+
+    def outcome(self) -> Value[Any] | Error:
+        if not self.is_error:
+            return _make_value(self.payload)
+        self.payload.__traceback__ = self.tb
+        return _make_error(self.payload)
+
+
+def _capture_result(exc: BaseException) -> _Result:
+    # Hide the frame of the wrapper that caught the exception, like capture()
+    # does.
+    tb = exc.__traceback__
+    if tb is not None:
+        tb = exc.__traceback__ = tb.tb_next
+    return _Result(exc, True, tb)
+
+
+class _InFlight:
+    __slots__ = ('event', 'result')
+
+    def __init__(self, event: Any) -> None:
+        self.event = event
+        self.result: Optional[_Result] = None
+
+
+def _new_event() -> Any:
+    if current_async_library() == "trio":
+        import trio
+
+        return trio.Event()
+    import asyncio
+
+    return asyncio.Event()
+
+
+_KWARGS_MARK = object()
+
+
+def _make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(kwargs.items())
+
+
+class _Cache:
+    def __init__(
+            self,
+            maxsize: Optional[int],
+            value_ttl: Optional[float],
+            error_ttl: Optional[float],
+    ) -> None:
+        self.maxsize = maxsize
+        self.value_ttl = value_ttl
+        self.error_ttl = error_ttl
+        self.results: OrderedDict[Hashable, _Result] = OrderedDict()
+        self.in_flight: Dict[Hashable, _InFlight] = {}
+        self.hits = self.misses = self.coalesced = 0
+
+    def lookup(self, key: Hashable) -> Optional[_Result]:
+        result = self.results.get(key)
+        if result is None:
+            return None
+        if result.expires is not None and result.expires <= monotonic():
+            del self.results[key]
+            return None
+        self.results.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def store(self, key: Hashable, result: _Result) -> None:
+        if result.is_error:
+            # Cancellation, KeyboardInterrupt and the like are about this
+            # particular call, not about its arguments.
+            if not isinstance(result.payload, Exception):
+                return
+            ttl = self.error_ttl
+        else:
+            ttl = self.value_ttl
+        if ttl is not None:
+            if ttl <= 0:
+                return
+            result.expires = monotonic() + ttl
+        self.results[key] = result
+        self.results.move_to_end(key)
+        if self.maxsize is not None and len(self.results) > self.maxsize:
+            self.results.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.coalesced,
+            self.maxsize,
+            len(self.results),
+        )
+
+    def clear(self) -> None:
+        self.results.clear()
+        self.hits = self.misses = self.coalesced = 0
+
+
+# Used bare, as @memoize. The coroutine function overload has to come first,
+# as for Memoizer.
+@overload
+def memoize(  # type: ignore[overload-overlap]
+        maxsize: Callable[ArgsT, Coroutine[Any, Any, ResultT]],
+) -> MemoizedFunction[ArgsT, AsyncMaybe[ResultT]]:
+    ...
+
+
+@overload
+def memoize(
+        maxsize: Callable[ArgsT, ResultT],
+) -> MemoizedFunction[ArgsT, Value[ResultT] | Error]:
+    ...
+
+
+@overload
+def memoize(
+        maxsize: Optional[int] = 128,
+        *,
+        value_ttl: Optional[float] = None,
+        error_ttl: Optional[float] = 0,
+) -> Memoizer:
+    ...
+
+
+def memoize(
+        maxsize: Any = 128,
+        *,
+        value_ttl: Optional[float] = None,
+        error_ttl: Optional[float] = 0,
+) -> Any:
+    """Decorator that caches the outcome of calls to the decorated function.
+
+    The decorated function returns a fresh :class:`~outcome.Value` or
+    :class:`~outcome.Error` on every call, whether the result came from the
+    cache or not, as if it had been called through :func:`outcome.capture`.
+    If it's a coroutine function, the decorated function is too, and works
+    like :func:`outcome.acapture`. While an async call is running, other calls
+    with the same arguments wait for it and share its result, rather than
+    running the function again.
+
+    As with :func:`functools.lru_cache`, the arguments must be hashable, and
+    the decorated function has ``cache_info()`` and ``cache_clear()``
+    methods; ``cache_info()`` returns a :class:`CacheInfo`. Also like
+    :func:`~functools.lru_cache`, this can be applied directly, as
+    ``@memoize`` with no parentheses, to use the defaults.
+
+    Args:
+      maxsize: How many results to keep. Once there are more, the least
+          recently used one is dropped. ``None`` means no limit.
+      value_ttl: How many seconds a returned value is cached for. ``None``
+          means until it's evicted.
+      error_ttl: How many seconds a raised exception is cached for. The
+          default of 0 means exceptions aren't cached at all. Only
+          :exc:`Exception` subclasses are ever cached. The cached exception
+          object is shared by every :class:`~outcome.Error` built from it,
+          and its traceback is reset each time one is built.
+
+    """
+    if callable(maxsize):
+        # Used bare, as @memoize.
+        return memoize(value_ttl=value_ttl, error_ttl=error_ttl)(maxsize)
+    if maxsize is not None and not isinstance(maxsize, int):
+        raise TypeError(
+            f"maxsize must be an int, None or the function to decorate, "
+            f"not {maxsize!r}"
+        )
+    if maxsize is not None and maxsize < 1:
+        raise ValueError(f"maxsize must be at least 1, not {maxsize!r}")
+
+    def decorator(fn: Callable[..., Any]) -> Any:
+        cache = _Cache(maxsize, value_ttl, error_ttl)
+        # Any, since the cache methods are attached to it below.
+        wrapper: Any
+        if inspect.iscoroutinefunction(fn):
+            wrapper = _async_wrapper(fn, cache)
+        else:
+            wrapper = _sync_wrapper(fn, cache)
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def _sync_wrapper(
+        fn: Callable[..., Any],
+        cache: _Cache,
+) -> Callable[..., Value[Any] | Error]:
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Value[Any] | Error:
+        key = args if not kwargs else _make_key(args, kwargs)
+        result = cache.lookup(key)
+        if result is None:
+            cache.misses += 1
+            try:
+                result = _Result(fn(*args, **kwargs), False, None)
+            except BaseException as exc:
+                result = _capture_result(exc)
+            cache.store(key, result)
+        return result.outcome()
+
+    return wrapper
+
+
+def _async_wrapper(
+        fn: Callable[..., Any],
+        cache: _Cache,
+) -> Callable[..., Coroutine[Any, Any, Value[Any] | Error]]:
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Value[Any] | Error:
+        key = _make_key(args, kwargs)
+        while True:
+            result = cache.lookup(key)
+            if result is not None:
+                return result.outcome()
+            in_flight = cache.in_flight.get(key)
+            if in_flight is None:
+                break
+            await in_flight.event.wait()
+            result = in_flight.result
+            # If the call we waited for was cancelled, that doesn't apply to
+            # us, so go round again and make the call ourselves.
+            if result is not None and (not result.is_error or isinstance(
+                    result.payload, Exception)):
+                cache.coalesced += 1
+                return result.outcome()
+
+        cache.misses += 1
+        in_flight = cache.in_flight[key] = _InFlight(_new_event())
+        try:
+            try:
+                result = _Result(await fn(*args, **kwargs), False, None)
+            except BaseException as exc:
+                result = _capture_result(exc)
+            in_flight.result = result
+            cache.store(key, result)
+            return result.outcome()
+        finally:
+            del cache.in_flight[key]
+            in_flight.event.set()
+
+    return wrapper
@@ -0,0 +1,207 @@
+"""Coalescing of repeated errors, to bound memory use during error storms.
+
+When a dependency goes down, the same call can fail thousands of times a
+second with the same exception, and every :class:`~outcome.Error` built from
+it keeps its own exception, traceback and frames (with their local
+variables) alive. An :class:`ErrorCoalescer` captures calls like
+:func:`outcome.capture` does, but hands back Errors that share a single
+representative exception for repeats of the same failure, so only one
+traceback is kept per distinct failure.
+
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    TypeVar,
+)
+
+from ._impl import Error, Value, _make_captured_error, _make_error, _make_value
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import ParamSpec
+    ArgsT = ParamSpec("ArgsT")
+
+__all__ = ['ErrorCoalescer']
+
+ResultT = TypeVar("ResultT")
+
+
+class _Entry:
+    __slots__ = ('exc', 'tb', 'expires', 'count')
+
+    def __init__(
+            self,
+            exc: BaseException,
+            tb: TracebackType | None,
+            expires: float,
+    ) -> None:
+        self.exc = exc
+        # The traceback of the representative as it was captured, which it's
+        # reset to every time it's handed out, since unwrapping the Errors
+        # handed out before will have raised it and so added more frames.
+        self.tb = tb
+        self.expires = expires
+        self.count = 1
+
+    def error(self) -> Error:
+        self.exc.__traceback__ = self.tb
+        return _make_error(self.exc)
+
+
+def _key(exc: BaseException) -> Optional[Hashable]:
+    """Return what identifies repeats of *exc*: its type, its state, and the
+    line of code that raised it. Returns None if the state isn't hashable.
+
+    The state is what pickling would save: the arguments from __reduce__()
+    and the instance __dict__. That covers attributes that aren't in args,
+    like an OSError's filename, which would otherwise be handed out for a
+    different file.
+
+    """
+    tb = exc.__traceback__
+    if tb is None:
+        origin = None
+    else:
+        while tb.tb_next is not None:
+            tb = tb.tb_next
+        origin = (tb.tb_frame.f_code, tb.tb_lineno)
+    try:
+        key = (
+            type(exc),
+            exc.__reduce__()[1],
+            tuple(exc.__dict__.items()),
+            origin,
+        )
+        hash(key)
+    except Exception:
+        return None
+    return key
+
+
+class ErrorCoalescer:
+    """Capture calls, sharing one exception between the :class:`Error`
+    objects for repeats of the same failure.
+
+    Two exceptions count as the same failure if they have the same type and
+    the same state, and were raised by the same line of code. The state is
+    what pickling them would save, which is their ``args`` and any other
+    attributes, such as an :exc:`OSError`'s ``filename``. The first one
+    seen becomes the representative, and for the next *window* seconds every
+    repeat is dropped (along with its traceback) and returned as a new
+    :class:`~outcome.Error` holding the representative instead. After that,
+    the next repeat starts a new window with itself as the representative.
+    Exceptions whose state isn't hashable are never coalesced.
+
+    At most *max_size* failures are tracked at once; past that, new kinds of
+    failure are captured normally until older windows expire.
+
+    The coalesced errors all hold the *same* exception object, so anything
+    that changes it (like adding a note) is seen through all of them. Its
+    traceback is put back to the one it was captured with each time a new
+    :class:`~outcome.Error` is handed out, so raising it doesn't make it
+    grow. This is meant for places that mostly log, count or drop their
+    errors.
+
+    """
+
+    def __init__(self, window: float = 1.0, *, max_size: int = 1024) -> None:
+        if window <= 0:
+            raise ValueError(f"window must be positive, not {window!r}")
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, not {max_size!r}")
+        self.window = window
+        self.max_size = max_size
+        # In the order the windows started, which is also the order they
+        # expire in.
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        # id(representative) -> entry, for repeat_count().
+        self._by_id: Dict[int, _Entry] = {}
+
+    def capture(
+            self,
+            sync_fn: Callable[ArgsT, ResultT],
+            *args: ArgsT.args,
+            **kwargs: ArgsT.kwargs,
+    ) -> Value[ResultT] | Error:
+        """Like :func:`outcome.capture`, but coalescing repeated errors."""
+        try:
+            return _make_value(sync_fn(*args, **kwargs))
+        except BaseException as exc:
+            return self._coalesce(exc)
+
+    async def acapture(
+            self,
+            async_fn: Callable[ArgsT, Awaitable[ResultT]],
+            *args: ArgsT.args,
+            **kwargs: ArgsT.kwargs,
+    ) -> Value[ResultT] | Error:
+        """Like :func:`outcome.acapture`, but coalescing repeated errors."""
+        try:
+            return _make_value(await async_fn(*args, **kwargs))
+        except BaseException as exc:
+            return self._coalesce(exc)
+
+    def repeat_count(self, exc: BaseException) -> int:
+        """Return how many times *exc* has been captured in its current
+        window, counting the first time, or 0 if *exc* isn't the
+        representative of a window that is still being tracked."""
+        entry = self._by_id.get(id(exc))
+        if entry is None or entry.exc is not exc:
+            return 0
+        return entry.count
+
+    def clear(self) -> None:
+        """Forget every tracked failure, so that the next of each kind starts
+        a new window."""
+        self._entries.clear()
+        self._by_id.clear()
+
+    def _coalesce(self, exc: BaseException) -> Error:
+        key = _key(exc)
+        if key is None:
+            return _make_captured_error(exc)
+        now = monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now < entry.expires:
+            entry.count += 1
+            return entry.error()
+        # Starting a new window, so drop the ones that have ended, including
+        # this key's previous one, to free their exceptions and frames.
+        self._expire(now)
+        if key in self._entries:
+            # Only still here if the window was changed in the meantime.
+            self._forget(key)
+        if len(self._entries) >= self.max_size:
+            return _make_captured_error(exc)
+        # Hide the frame of capture() from the traceback, like
+        # outcome.capture() does.
+        tb = exc.__traceback__
+        if tb is not None:
+            tb = tb.tb_next
+        entry = _Entry(exc, tb, now + self.window)
+        self._entries[key] = entry
+        self._by_id[id(exc)] = entry
+        return entry.error()
+
+    def _expire(self, now: float) -> None:
+        entries = self._entries
+        while entries:
+            key, entry = next(iter(entries.items()))
+            if now < entry.expires:
+                break
+            self._forget(key)
+
+    def _forget(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        del self._by_id[id(entry.exc)]
@@ -0,0 +1,76 @@
+"""Helpers for capturing outcomes in :mod:`concurrent.futures` executors."""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, Future
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, TypeVar
+
+from ._impl import Error, Value, capture
+
+if TYPE_CHECKING:
+    from typing_extensions import ParamSpec
+    ArgsT = ParamSpec("ArgsT")
+
+__all__ = ['map_outcomes', 'submit_capture']
+
+ResultT = TypeVar("ResultT")
+
+
+def submit_capture(
+        executor: Executor,
+        sync_fn: Callable[ArgsT, ResultT],
+        *args: ArgsT.args,
+        **kwargs: ArgsT.kwargs,
+) -> Future[Value[ResultT] | Error]:
+    """Schedule ``sync_fn(*args, **kwargs)`` to run in *executor*, capturing
+    the result in the worker.
+
+    This works with both :class:`~concurrent.futures.ThreadPoolExecutor` and
+    :class:`~concurrent.futures.ProcessPoolExecutor`. The returned future's
+    result is the :class:`~outcome.Value` or :class:`~outcome.Error` built in
+    the worker, so calling ``.result()`` on it never raises the function's
+    exception.
+
+    Returns:
+      A :class:`~concurrent.futures.Future` resolving to a
+      :class:`~outcome.Value` or :class:`~outcome.Error`.
+
+    """
+    # Mypy can't match the overloaded capture() against submit()'s ParamSpec.
+    return executor.submit(
+        capture,  # type: ignore[arg-type]
+        sync_fn,
+        *args,
+        **kwargs,
+    )
+
+
+def map_outcomes(
+        executor: Executor,
+        sync_fn: Callable[..., ResultT],
+        *iterables: Iterable[Any],
+        timeout: float | None = None,
+        chunksize: int = 1,
+) -> Iterator[Value[ResultT] | Error]:
+    """Like :meth:`Executor.map() <concurrent.futures.Executor.map>`, but
+    yields a :class:`~outcome.Value` or :class:`~outcome.Error` for each call
+    instead of stopping at the first exception.
+
+    *timeout* and *chunksize* are passed through to
+    :meth:`~concurrent.futures.Executor.map`.
+
+    Returns:
+      An iterator of :class:`~outcome.Value` and :class:`~outcome.Error`
+      objects, in the same order as the arguments.
+
+    """
+    # Not repeat(sync_fn) as another iterable, which would never run out if
+    # there are no others. A partial of capture() still pickles, for process
+    # pools.
+    return executor.map(
+        partial(capture, sync_fn),
+        *iterables,
+        timeout=timeout,
+        chunksize=chunksize,
+    )
@@ -0,0 +1,306 @@
+"""Opt-in tools for watching how outcomes are created and used.
+
+All of these are off by default, and cost a single global check per outcome
+while they're off. Call :func:`enable` to start counting and :func:`snapshot`
+to read the counters, e.g. to export them to a metrics system. Call
+:func:`enable_sampling` to find out which lines of code are creating the
+outcomes, and :func:`enable_leak_detection` to be warned about errors that
+are never looked at.
+
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import warnings
+import weakref
+from collections import Counter
+from time import perf_counter
+from types import CodeType, FrameType
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from . import _impl
+from ._impl import Error, Outcome, Value, _Observer, _store_created_at
+
+__all__ = [
+    'LeakedErrorWarning', 'disable', 'disable_leak_detection',
+    'disable_sampling', 'enable', 'enable_leak_detection', 'enable_sampling',
+    'is_enabled', 'reset', 'snapshot', 'top_sites'
+]
+
+_Snapshot = Dict[str, Union[int, float, Dict[str, int]]]
+_AlreadyUsedCallback = Callable[[Outcome[object]], None]
+
+
+class _Counters(_Observer):
+    def __init__(self) -> None:
+        self.on_already_used: Optional[_AlreadyUsedCallback] = None
+        self.reset()
+
+    def reset(self) -> None:
+        self.values_created = 0
+        self.errors_created = 0
+        self.errors_by_type: Counter[type[BaseException]] = Counter()
+        self.uses = 0
+        self.uses_timed = 0
+        self.already_used = 0
+        self.use_latency_total = 0.0
+        self.use_latency_max = 0.0
+
+    def created(self, outcome: Value[object] | Error) -> None:
+        if type(outcome) is Error:
+            self.errors_created += 1
+            self.errors_by_type[type(outcome._error)] += 1
+        else:
+            self.values_created += 1
+        _store_created_at(outcome, perf_counter())
+
+    def used(self, outcome: Outcome[object]) -> None:
+        self.uses += 1
+        try:
+            created_at = outcome._created_at
+        except AttributeError:
+            # Created before instrumentation was enabled.
+            return
+        latency = perf_counter() - created_at
+        self.uses_timed += 1
+        self.use_latency_total += latency
+        if latency > self.use_latency_max:
+            self.use_latency_max = latency
+
+    def used_again(self, outcome: Outcome[object]) -> None:
+        self.already_used += 1
+        if self.on_already_used is not None:
+            self.on_already_used(outcome)
+
+
+_counters = _Counters()
+
+
+def enable(
+        *,
+        on_already_used: Optional[_AlreadyUsedCallback] = None,
+) -> None:
+    """Start counting.
+
+    Counting carries on from the current counts; use :func:`reset` to start
+    again from zero.
+
+    Args:
+      on_already_used: If given, this is called with the outcome every time
+          something tries to use an outcome that was already used, just
+          before :exc:`~outcome.AlreadyUsedError` is raised.
+
+    """
+    _counters.on_already_used = on_already_used
+    if not is_enabled():
+        _impl._add_observer(_counters)
+
+
+def disable() -> None:
+    """Stop counting. The counts so far are kept."""
+    _impl._remove_observer(_counters)
+
+
+def is_enabled() -> bool:
+    """Return whether instrumentation is currently enabled."""
+    return _counters in _impl._observers
+
+
+def reset() -> None:
+    """Set all the counters back to zero, and forget the sampled creation
+    sites."""
+    _counters.reset()
+    _sampler.reset()
+
+
+def snapshot() -> _Snapshot:
+    """Return the current counts as a dict.
+
+    The dict has these keys:
+
+    * ``"values_created"``, ``"errors_created"``: How many
+      :class:`~outcome.Value` and :class:`~outcome.Error` objects were
+      created.
+    * ``"errors_by_type"``: A dict mapping the qualified names of the
+      exception types in those :class:`~outcome.Error` objects to how often
+      each one appeared.
+    * ``"uses"``: How many outcomes were used, by
+      :meth:`~outcome.Outcome.unwrap`, :meth:`~outcome.Outcome.send`, etc.
+    * ``"use_latency_total"``, ``"use_latency_max"``: The total and largest
+      time in seconds between an outcome being created and being used, for
+      the ``"uses_timed"`` outcomes that were also created while enabled.
+    * ``"already_used"``: How many times
+      :exc:`~outcome.AlreadyUsedError` was raised.
+
+    """
+    c = _counters
+    return {
+        "values_created": c.values_created,
+        "errors_created": c.errors_created,
+        "errors_by_type":
+            {
+                f"{exc_type.__module__}.{exc_type.__qualname__}": count
+                for exc_type, count in c.errors_by_type.items()
+            },
+        "uses": c.uses,
+        "uses_timed": c.uses_timed,
+        "use_latency_total": c.use_latency_total,
+        "use_latency_max": c.use_latency_max,
+        "already_used": c.already_used,
+    }
+
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(_impl.__file__)) + os.sep
+
+
+def _caller_frame() -> Optional[FrameType]:
+    """Return the innermost frame outside of this package."""
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None:
+        if not frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+            return frame
+        frame = frame.f_back
+    return None
+
+
+def _caller_site() -> Tuple[str, int]:
+    """Return the file name and line number of the innermost frame outside
+    of this package."""
+    frame = _caller_frame()
+    if frame is None:
+        return "<unknown>", 0
+    return frame.f_code.co_filename, frame.f_lineno
+
+
+class _SiteSampler:
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        # Keyed by code object rather than file name, so that taking a sample
+        # doesn't need to build any strings.
+        self.sites: Counter[Tuple[CodeType, int]] = Counter()
+
+    def sample(self, outcome: Value[object] | Error) -> None:
+        frame = _caller_frame()
+        if frame is not None:
+            self.sites[frame.f_code, frame.f_lineno] += 1
+
+
+_sampler = _SiteSampler()
+
+
+def enable_sampling(every: int = 1000) -> None:
+    """Start recording where outcomes are created, for one outcome in every
+    *every*.
+
+    For each sampled outcome, this records the line of code outside of
+    :mod:`outcome` that created it, e.g. the call to :func:`~outcome.capture`.
+    The outcomes in between are only counted down, so at the default rate
+    this is cheap enough to leave on in production. Use :func:`top_sites` to
+    see the results.
+
+    Calling this again while sampling just changes the rate.
+
+    """
+    if every < 1:
+        raise ValueError(f"every must be at least 1, not {every!r}")
+    _impl._set_sampler(_sampler.sample, every)
+
+
+def disable_sampling() -> None:
+    """Stop recording where outcomes are created. The samples so far are
+    kept."""
+    _impl._set_sampler(None)
+
+
+def top_sites(k: int = 10) -> List[Tuple[str, int, str, int]]:
+    """Return the *k* lines of code that created the most sampled outcomes.
+
+    Returns:
+      A list of ``(filename, lineno, function_name, samples)`` tuples, most
+      common first. Multiply *samples* by the sampling rate passed to
+      :func:`enable_sampling` to estimate the real number of outcomes.
+
+    """
+    return [
+        (code.co_filename, lineno, code.co_name, samples)
+        for (code, lineno), samples in _sampler.sites.most_common(k)
+    ]
+
+
+class LeakedErrorWarning(RuntimeWarning):
+    """Warning issued when an :class:`~outcome.Error` is garbage collected
+    without ever having been used, while leak detection is enabled.
+
+    The warning is attributed to the place where the :class:`~outcome.Error`
+    was created.
+
+    """
+
+
+class _LeakDetector(_Observer):
+    def __init__(self) -> None:
+        self.finalizers: Dict[int, weakref.finalize[..., Error]] = {}
+
+    def created(self, outcome: Value[object] | Error) -> None:
+        if type(outcome) is not Error:
+            return
+        key = id(outcome)
+        self.finalizers[key] = weakref.finalize(
+            outcome, self.leaked, key, outcome._error, *_caller_site()
+        )
+
+    def used(self, outcome: Outcome[object]) -> None:
+        finalizer = self.finalizers.pop(id(outcome), None)
+        if finalizer is not None:
+            finalizer.detach()
+
+    def leaked(
+            self,
+            key: int,
+            exc: BaseException,
+            filename: str,
+            lineno: int,
+    ) -> None:
+        del self.finalizers[key]
+        warnings.warn_explicit(
+            f"Error({exc!r}) was garbage collected without being used",
+            LeakedErrorWarning,
+            filename,
+            lineno,
+        )
+
+    def clear(self) -> None:
+        for finalizer in self.finalizers.values():
+            finalizer.detach()
+        self.finalizers.clear()
+
+
+_leak_detector = _LeakDetector()
+
+
+def enable_leak_detection() -> None:
+    """Warn about :class:`~outcome.Error` objects that are never used.
+
+    From now on, every :class:`~outcome.Error` that is garbage collected
+    without being unwrapped or sent anywhere issues a
+    :exc:`LeakedErrorWarning`, pointing at the code that created it. Such
+    errors usually mean an exception was silently lost.
+
+    This registers a :class:`weakref.finalize` for every
+    :class:`~outcome.Error`, so it's meant for debugging and tests rather than
+    production.
+
+    """
+    if _leak_detector not in _impl._observers:
+        _impl._add_observer(_leak_detector)
+
+
+def disable_leak_detection() -> None:
+    """Stop warning about unused :class:`~outcome.Error` objects, including
+    ones created while leak detection was enabled."""
+    _impl._remove_observer(_leak_detector)
+    _leak_detector.clear()
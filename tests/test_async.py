@@ -26,6 +26,21 @@ async def test_acapture():
     assert e.error.args == (9,)
 
 
+async def test_acaptured():
+    async def add(x, y):
+        await asyncio.sleep(0)
+        return x + y
+
+    for decorator in [outcome.captured, outcome.acaptured]:
+        wrapped = decorator(add)
+        assert wrapped.__name__ == "add"
+        assert await wrapped(3, y=4) == Value(7)
+        e = await wrapped(3, "x")
+        assert type(e.error) is TypeError
+        frame = e.error.__traceback__.tb_frame
+        assert frame.f_code is add.__code__
+
+
 async def test_asend():
     async def my_agen_func():
         assert (yield 1) == "value"
@@ -58,3 +73,100 @@ async def test_traceback_frame_removal():
     frames = traceback.extract_tb(exc_info.value.__traceback__)
     functions = [function for _, _, function, _ in frames]
     assert functions[-2:] == ['unwrap', 'raise_ValueError']
+
+
+async def test_asend_release():
+    async def my_agen_func():
+        assert (yield 1) == "value"
+        with pytest.raises(KeyError):
+            yield 2
+        yield 3
+
+    my_agen = my_agen_func().__aiter__()
+    v = Value("value")
+    e = Error(KeyError())
+    assert (await my_agen.asend(None)) == 1
+    assert (await v.asend(my_agen, release=True)) == 2
+    assert (await e.asend(my_agen, release=True)) == 3
+    with pytest.raises(AlreadyUsedError):
+        v.value
+    with pytest.raises(AlreadyUsedError):
+        e.error
+
+
+async def test_adrive():
+    async def doubler():
+        total = 0
+        while True:
+            try:
+                x = yield total
+            except KeyError:
+                return
+            await asyncio.sleep(0)
+            total = x * 2
+
+    agen = doubler()
+    await agen.asend(None)
+    outcomes = [Value(1), Value(2), Error(KeyError()), Value(3)]
+    results = await outcome.adrive(agen, outcomes)
+    assert results[:2] == [Value(2), Value(4)]
+    assert type(results[2].error) is StopAsyncIteration
+    assert len(results) == 3
+    assert outcomes[3].unwrap() == 3
+
+    used = Value(1)
+    used.unwrap()
+    with pytest.raises(AlreadyUsedError):
+        await outcome.adrive(agen, [used])
+
+
+async def test_step_coroutine():
+    class Trap:
+        def __await__(self):
+            return (yield "trap")
+
+    async def task():
+        assert (await Trap()) == 1
+        return "done"
+
+    coro = task()
+    assert outcome.step(coro, Value(None)) == ("trap", None)
+    assert outcome.step(coro, Value(1)) == (None, Value("done"))
+
+
+async def agen_then_raise():
+    yield 1
+    await asyncio.sleep(0)
+    yield 2
+    raise KeyError
+
+
+async def test_acapture_iter():
+    results = [o async for o in outcome.acapture_iter(agen_then_raise())]
+    assert results[:2] == [Value(1), Value(2)]
+    assert type(results[2].error) is KeyError
+    assert len(results) == 3
+
+    results = [o async for o in outcome.acapture_iter([])]
+    assert len(results) == 1
+    assert type(results[0].error) is AttributeError
+
+
+async def test_acapture_iter_chunks():
+    chunks = [
+        c async for c in outcome.acapture_iter_chunks(agen_then_raise(), 2)
+    ]
+    assert len(chunks) == 2
+    assert chunks[0] == [Value(1), Value(2)]
+    [e] = chunks[1]
+    assert type(e.error) is KeyError
+
+    async def agen():
+        for i in range(3):
+            yield i
+
+    chunks = [c async for c in outcome.acapture_iter_chunks(agen(), 2)]
+    assert chunks == [[Value(0), Value(1)], [Value(2)]]
+
+    with pytest.raises(ValueError):
+        outcome.acapture_iter_chunks(agen(), 0)
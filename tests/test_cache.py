@@ -0,0 +1,202 @@
+import asyncio
+
+import pytest
+
+from outcome import AlreadyUsedError, Error, Value
+from outcome.cache import CacheInfo, memoize
+
+
+def test_memoize():
+    calls = []
+
+    @memoize(maxsize=2)
+    def square(x):
+        """Docstring."""
+        calls.append(x)
+        return x * x
+
+    assert square.__name__ == "square"
+    assert square.__doc__ == "Docstring."
+
+    v1 = square(2)
+    v2 = square(2)
+    assert v1 == v2 == Value(4)
+    assert v1 is not v2
+    assert calls == [2]
+    # each hit is a fresh outcome, which is single-use as usual
+    v1.unwrap()
+    with pytest.raises(AlreadyUsedError):
+        v1.unwrap()
+    assert square(2).unwrap() == 4
+
+    # keyword arguments are part of the key
+    assert square(x=2) == Value(4)
+    assert calls == [2, 2]
+
+    # least recently used is evicted
+    square(3)
+    assert square.cache_info() == CacheInfo(
+        hits=2, misses=3, coalesced=0, maxsize=2, currsize=2
+    )
+    square(2)
+    assert calls == [2, 2, 3, 2]
+
+    square.cache_clear()
+    assert square.cache_info() == CacheInfo(0, 0, 0, 2, 0)
+
+    with pytest.raises(TypeError):
+        square([])
+
+    with pytest.raises(ValueError):
+        memoize(maxsize=0)
+    with pytest.raises(TypeError):
+        memoize("10")
+
+
+def test_memoize_bare():
+    calls = []
+
+    # like lru_cache, it can be used without calling it first
+    @memoize
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert square(3) == Value(9)
+    assert square(3) == Value(9)
+    assert calls == [3]
+    assert square.cache_info() == CacheInfo(1, 1, 0, 128, 1)
+
+    @memoize
+    async def async_square(x):
+        return x * x
+
+    assert asyncio.run(async_square(2)) == Value(4)
+
+
+def test_memoize_errors():
+    calls = []
+
+    @memoize()
+    def not_cached(x):
+        calls.append(x)
+        raise KeyError(x)
+
+    assert type(not_cached(1)) is Error
+    assert type(not_cached(1)) is Error
+    assert calls == [1, 1]
+
+    @memoize(error_ttl=None)
+    def fail(x):
+        calls.append(x)
+        raise KeyError(x)
+
+    calls.clear()
+    e1 = fail(1)
+    e2 = fail(1)
+    assert calls == [1]
+    assert e1.error is e2.error
+    # the traceback is reset on each hit, so raising it again doesn't make it
+    # grow
+    with pytest.raises(KeyError):
+        e1.unwrap()
+    e3 = fail(1)
+    assert e3.error.__traceback__.tb_frame.f_code is fail.__wrapped__.__code__
+    assert e3.error.__traceback__.tb_next is None
+
+    # only Exceptions are cached
+    @memoize(error_ttl=None)
+    def interrupt():
+        calls.append(None)
+        raise KeyboardInterrupt
+
+    calls.clear()
+    assert type(interrupt().error) is KeyboardInterrupt
+    assert type(interrupt().error) is KeyboardInterrupt
+    assert calls == [None, None]
+
+
+def test_memoize_ttl(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("outcome.cache.monotonic", lambda: now)
+    calls = []
+
+    @memoize(value_ttl=10, error_ttl=1)
+    def check(x):
+        calls.append(x)
+        if x < 0:
+            raise ValueError(x)
+        return x
+
+    check(1)
+    check(-1)
+    now += 2
+    check(1)
+    check(-1)
+    assert calls == [1, -1, -1]
+    now += 10
+    check(1)
+    assert calls == [1, -1, -1, 1]
+
+
+@pytest.mark.asyncio
+async def test_memoize_async():
+    calls = []
+
+    @memoize()
+    async def slow_square(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x * x
+
+    results = await asyncio.gather(*[slow_square(3) for _ in range(5)])
+    assert results == [Value(9)] * 5
+    assert calls == [3]
+    assert await slow_square(3) == Value(9)
+    assert slow_square.cache_info() == CacheInfo(1, 1, 4, 128, 1)
+
+
+@pytest.mark.asyncio
+async def test_memoize_async_cancelled_leader():
+    calls = []
+
+    @memoize()
+    async def slow(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x
+
+    leader = asyncio.ensure_future(slow(1))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(slow(1))
+    await asyncio.sleep(0)
+    leader.cancel()
+    # the follower doesn't inherit the leader's cancellation
+    assert await follower == Value(1)
+    assert type(await leader) is Error
+    assert calls == [1, 1]
+
+
+def test_memoize_trio():
+    trio = pytest.importorskip("trio")
+    calls = []
+
+    @memoize()
+    async def slow_square(x):
+        calls.append(x)
+        await trio.sleep(0.01)
+        return x * x
+
+    async def main():
+        results = []
+
+        async def run():
+            results.append(await slow_square(3))
+
+        async with trio.open_nursery() as nursery:
+            for _ in range(3):
+                nursery.start_soon(run)
+        return results
+
+    assert trio.run(main) == [Value(9)] * 3
+    assert calls == [3]
@@ -0,0 +1,189 @@
+import asyncio
+import gc
+import weakref
+
+import pytest
+
+from outcome import Error, Value
+from outcome.coalesce import ErrorCoalescer
+
+
+def connect(port):
+    raise ConnectionRefusedError(port)
+
+
+def connect_elsewhere(port):
+    raise ConnectionRefusedError(port)
+
+
+def test_coalescing():
+    coalescer = ErrorCoalescer(window=60)
+    assert coalescer.capture(int, "1") == Value(1)
+
+    errors = [coalescer.capture(connect, 80) for _ in range(3)]
+    first = errors[0].error
+    assert all(type(e) is Error for e in errors)
+    assert all(e.error is first for e in errors)
+    assert coalescer.repeat_count(first) == 3
+    # the capture frame was trimmed from the shared traceback, once
+    assert first.__traceback__.tb_frame.f_code is connect.__code__
+
+    # different args or a different origin are different failures
+    other_port = coalescer.capture(connect, 443).error
+    other_origin = coalescer.capture(connect_elsewhere, 80).error
+    assert other_port is not first
+    assert other_origin is not first
+    assert coalescer.repeat_count(other_port) == 1
+
+    # unrelated exceptions aren't tracked
+    assert coalescer.repeat_count(KeyError()) == 0
+
+    # each Error is still single-use
+    with pytest.raises(ConnectionRefusedError):
+        errors[0].unwrap()
+    with pytest.raises(ConnectionRefusedError):
+        errors[1].unwrap()
+
+    coalescer.clear()
+    assert coalescer.repeat_count(first) == 0
+    assert coalescer.capture(connect, 80).error is not first
+
+
+def test_unwrap_does_not_grow_traceback():
+    coalescer = ErrorCoalescer(window=60)
+
+    def tb_length(exc):
+        length = 0
+        tb = exc.__traceback__
+        while tb is not None:
+            length += 1
+            tb = tb.tb_next
+        return length
+
+    first = coalescer.capture(connect, 80).error
+    expected = tb_length(first)
+    assert expected == 1
+    for _ in range(100):
+        e = coalescer.capture(connect, 80)
+        assert tb_length(e.error) == expected
+        with pytest.raises(ConnectionRefusedError):
+            e.unwrap()
+    assert tb_length(coalescer.capture(connect, 80).error) == expected
+
+
+class Refused(Exception):
+    pass
+
+
+def refuse(port):
+    raise Refused(port)
+
+
+def test_expired_windows_are_dropped(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("outcome.coalesce.monotonic", lambda: now)
+    coalescer = ErrorCoalescer(window=1.0)
+    ref = weakref.ref(coalescer.capture(refuse, 80).error)
+    gc.collect()
+    assert ref() is not None
+    now += 2
+    # a different failure starting a new window drops the expired one
+    coalescer.capture(refuse, 443)
+    gc.collect()
+    assert ref() is None
+    assert len(coalescer._entries) == 1
+
+
+def test_window_expiry(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("outcome.coalesce.monotonic", lambda: now)
+    coalescer = ErrorCoalescer(window=1.0)
+    first = coalescer.capture(connect, 80).error
+    now += 0.5
+    assert coalescer.capture(connect, 80).error is first
+    now += 1
+    second = coalescer.capture(connect, 80).error
+    assert second is not first
+    assert coalescer.repeat_count(first) == 0
+    assert coalescer.repeat_count(second) == 1
+
+
+def test_max_size(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("outcome.coalesce.monotonic", lambda: now)
+    coalescer = ErrorCoalescer(window=1.0, max_size=2)
+    a = coalescer.capture(connect, 1).error
+    coalescer.capture(connect, 2)
+    # full, so this one isn't tracked
+    c = coalescer.capture(connect, 3).error
+    assert coalescer.repeat_count(c) == 0
+    assert coalescer.capture(connect, 1).error is a
+    # once the old windows expire, there's room again
+    now += 2
+    c = coalescer.capture(connect, 3).error
+    assert coalescer.repeat_count(c) == 1
+    assert coalescer.repeat_count(a) == 0
+
+
+def test_state_outside_args():
+    coalescer = ErrorCoalescer(window=60)
+
+    def open_missing(name):
+        return open(f"/nonexistent/{name}")
+
+    a = coalescer.capture(open_missing, "a.txt").error
+    b = coalescer.capture(open_missing, "b.txt").error
+    # same type, args and line, but a different filename
+    assert a.args == b.args
+    assert a is not b
+    assert b.filename == "/nonexistent/b.txt"
+    assert coalescer.capture(open_missing, "a.txt").error is a
+
+    class Failed(Exception):
+        def __init__(self, code):
+            super().__init__("failed")
+            self.code = code
+
+    def fail(code):
+        raise Failed(code)
+
+    e1 = coalescer.capture(fail, 1).error
+    assert coalescer.capture(fail, 2).error is not e1
+    assert coalescer.capture(fail, 1).error is e1
+
+    # unhashable extra state isn't coalesced
+    e1 = coalescer.capture(fail, []).error
+    assert coalescer.capture(fail, []).error is not e1
+
+
+def test_unhashable_args():
+    coalescer = ErrorCoalescer()
+
+    def raise_unhashable():
+        raise ValueError([])
+
+    e1 = coalescer.capture(raise_unhashable).error
+    e2 = coalescer.capture(raise_unhashable).error
+    assert e1 is not e2
+    assert coalescer.repeat_count(e1) == 0
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError):
+        ErrorCoalescer(window=0)
+    with pytest.raises(ValueError):
+        ErrorCoalescer(max_size=0)
+
+
+@pytest.mark.asyncio
+async def test_acapture():
+    async def aconnect(port):
+        await asyncio.sleep(0)
+        raise ConnectionRefusedError(port)
+
+    coalescer = ErrorCoalescer()
+    assert await coalescer.acapture(asyncio.sleep, 0, "x") == Value("x")
+    e1 = await coalescer.acapture(aconnect, 80)
+    e2 = await coalescer.acapture(aconnect, 80)
+    assert e1.error is e2.error
+    assert coalescer.repeat_count(e1.error) == 2
@@ -0,0 +1,47 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from outcome import Error, Value
+from outcome.executor import map_outcomes, submit_capture
+
+
+def check_positive(x, *, scale=1):
+    if x <= 0:
+        raise ValueError(x)
+    return x * scale
+
+
+@pytest.mark.parametrize(
+    "executor_type",
+    [ThreadPoolExecutor, ProcessPoolExecutor]
+)
+def test_submit_capture(executor_type):
+    with executor_type(max_workers=2) as executor:
+        value = submit_capture(executor, check_positive, 2, scale=3).result()
+        error = submit_capture(executor, check_positive, -1).result()
+    assert value == Value(6)
+    assert type(error) is Error
+    assert type(error.error) is ValueError
+    assert error.error.args == (-1,)
+    with pytest.raises(ValueError):
+        error.unwrap()
+
+
+@pytest.mark.parametrize(
+    "executor_type",
+    [ThreadPoolExecutor, ProcessPoolExecutor]
+)
+def test_map_outcomes(executor_type):
+    with executor_type(max_workers=2) as executor:
+        results = list(
+            map_outcomes(executor, check_positive, [1, -2, 3], chunksize=2)
+        )
+    assert results[0] == Value(1)
+    assert type(results[1]) is Error
+    assert results[1].error.args == (-2,)
+    assert results[2] == Value(3)
+
+    # like Executor.map(), no iterables means no calls
+    with executor_type(max_workers=1) as executor:
+        assert list(map_outcomes(executor, check_positive)) == []
@@ -0,0 +1,153 @@
+import asyncio
+import subprocess
+import sys
+
+import pytest
+
+import outcome
+from outcome import Error, Value
+
+
+async def sleep_then_return(delay, value, running):
+    running.append(value)
+    try:
+        await asyncio.sleep(delay)
+    finally:
+        running.remove(value)
+    if isinstance(value, BaseException):
+        raise value
+    return value
+
+
+@pytest.mark.asyncio
+async def test_acapture_gather_asyncio():
+    running = []
+    exc = KeyError("oops")
+    results = await outcome.acapture_gather(
+        sleep_then_return,
+        [(0.02, 1, running),
+         (0.01, exc, running),
+         (0, 3, running)],
+    )
+    assert results == [Value(1), Error(exc), Value(3)]
+
+
+@pytest.mark.asyncio
+async def test_acapture_gather_without_sniffio(monkeypatch):
+    # without sniffio, asyncio is assumed
+    monkeypatch.setitem(sys.modules, "sniffio", None)
+    monkeypatch.setattr("outcome._util._detect_async_library", None)
+    results = await outcome.acapture_gather(
+        sleep_then_return, [(0, 1, []), (0, 2, [])]
+    )
+    assert results == [Value(1), Value(2)]
+    # and that's remembered, rather than trying to import it every time
+    assert outcome._util._detect_async_library() == "asyncio"
+
+
+def test_import_does_not_import_sniffio():
+    code = "import sys, outcome; print('sniffio' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    assert output.strip() == "False"
+
+
+@pytest.mark.asyncio
+async def test_acapture_gather_limit():
+    running = []
+    max_running = 0
+
+    async def track(value):
+        nonlocal max_running
+        running.append(value)
+        max_running = max(max_running, len(running))
+        await asyncio.sleep(0.001)
+        running.remove(value)
+        return value * 2
+
+    results = await outcome.acapture_gather(
+        track, [(i,) for i in range(10)], limit=3
+    )
+    assert results == [Value(i * 2) for i in range(10)]
+    assert max_running == 3
+
+    with pytest.raises(ValueError):
+        await outcome.acapture_gather(track, [], limit=0)
+
+
+@pytest.mark.asyncio
+async def test_acapture_gather_bad_call():
+    async def takes_one(x):
+        return x
+
+    results = await outcome.acapture_gather(takes_one, [(1,), (1, 2)])
+    assert results[0] == Value(1)
+    assert type(results[1]) is Error
+    assert type(results[1].error) is TypeError
+
+
+@pytest.mark.asyncio
+async def test_acapture_gather_cancel_pending():
+    started = asyncio.Event()
+    cancelled = []
+
+    async def wait_forever():
+        started.set()
+        try:
+            await asyncio.sleep(100)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    gather = asyncio.ensure_future(outcome.acapture_gather(wait_forever, [()]))
+    await started.wait()
+    gather.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await gather
+    await asyncio.sleep(0)
+    assert cancelled == [True]
+
+
+def test_acapture_gather_trio():
+    trio = pytest.importorskip("trio")
+
+    async def run(limit, expected_running):
+        running = []
+        max_running = 0
+        # Nothing finishes until as many calls are running at once as
+        # expected, so the result doesn't depend on timing.
+        enough_running = trio.Event()
+
+        async def track(value):
+            nonlocal max_running
+            running.append(value)
+            max_running = max(max_running, len(running))
+            if len(running) == expected_running:
+                enough_running.set()
+            await enough_running.wait()
+            running.remove(value)
+            if value == 5:
+                raise ValueError(value)
+            return value
+
+        results = await outcome.acapture_gather(
+            track, [(i,) for i in range(10)], limit=limit
+        )
+        return results, max_running
+
+    results, max_running = trio.run(run, None, 10)
+    assert len(results) == 10
+    assert type(results[5]) is Error
+    # the gather frame is hidden from the traceback
+    tb = results[5].error.__traceback__
+    assert tb.tb_frame.f_code.co_name == "track"
+    assert results[:5] == [Value(i) for i in range(5)]
+    assert max_running == 10
+
+    results, max_running = trio.run(run, 2, 2)
+    assert results[9] == Value(9)
+    assert max_running == 2
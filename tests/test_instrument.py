@@ -0,0 +1,160 @@
+import gc
+import sys
+import warnings
+
+import pytest
+
+import outcome
+from outcome import AlreadyUsedError, Error, Value, instrument
+
+
+@pytest.fixture
+def enabled():
+    instrument.reset()
+    instrument.enable()
+    try:
+        yield
+    finally:
+        instrument.disable()
+        instrument.reset()
+
+
+def test_disabled_by_default():
+    assert not instrument.is_enabled()
+    before = instrument.snapshot()
+    Value(1).unwrap()
+    assert instrument.snapshot() == before
+
+
+def test_counters(enabled):
+    assert instrument.is_enabled()
+    v = outcome.capture(int, "1")
+    outcome.capture(int, "x")
+    outcome.capture(int, "y")
+    outcome.capture(dict().__getitem__, "k")
+    Error(KeyError())
+    v.unwrap()
+    with pytest.raises(AlreadyUsedError):
+        v.unwrap()
+
+    snapshot = instrument.snapshot()
+    assert snapshot["values_created"] == 1
+    assert snapshot["errors_created"] == 4
+    assert snapshot["errors_by_type"] == {
+        "builtins.ValueError": 2,
+        "builtins.KeyError": 2,
+    }
+    assert snapshot["uses"] == 1
+    assert snapshot["uses_timed"] == 1
+    assert snapshot["use_latency_total"] >= snapshot["use_latency_max"] > 0
+    assert snapshot["already_used"] == 1
+
+    instrument.reset()
+    assert instrument.snapshot()["values_created"] == 0
+
+
+def test_counts_every_kind_of_use(enabled):
+    def gen():
+        while True:
+            try:
+                yield
+            except KeyError:
+                pass
+
+    it = gen()
+    next(it)
+    Value(1).send(it)
+    Error(KeyError()).send(it)
+    outcome.drive(it, [Value(1), Value(2)])
+    outcome.step(it, Value(3))
+    assert instrument.snapshot()["uses"] == 5
+
+
+def test_outcome_from_before_enable():
+    v = Value(1)
+    instrument.reset()
+    instrument.enable()
+    try:
+        v.unwrap()
+    finally:
+        instrument.disable()
+    snapshot = instrument.snapshot()
+    assert snapshot["uses"] == 1
+    assert snapshot["uses_timed"] == 0
+    instrument.reset()
+
+
+def test_on_already_used(enabled):
+    seen = []
+    instrument.enable(on_already_used=seen.append)
+    v = Value(1)
+    v.unwrap()
+    with pytest.raises(AlreadyUsedError):
+        v.unwrap()
+    assert seen == [v]
+
+
+def test_sampling():
+    instrument.reset()
+    instrument.enable_sampling(every=3)
+    try:
+        for _ in range(6):
+            outcome.capture(int, "1")
+        lineno = sys._getframe().f_lineno - 1
+        for _ in range(3):
+            Error(KeyError())
+    finally:
+        instrument.disable_sampling()
+    Value(1)
+
+    assert instrument.top_sites() == [
+        (__file__, lineno, "test_sampling", 2),
+        (__file__, lineno + 3, "test_sampling", 1),
+    ]
+    assert instrument.top_sites(1) == instrument.top_sites()[:1]
+    instrument.reset()
+    assert instrument.top_sites() == []
+
+    with pytest.raises(ValueError):
+        instrument.enable_sampling(every=0)
+
+
+@pytest.fixture
+def leak_detection():
+    instrument.enable_leak_detection()
+    try:
+        yield
+    finally:
+        instrument.disable_leak_detection()
+
+
+def test_leak_detection(leak_detection):
+    e = outcome.capture(int, "x")
+    lineno = sys._getframe().f_lineno - 1
+    with pytest.warns(instrument.LeakedErrorWarning) as record:
+        del e
+        gc.collect()
+    assert len(record) == 1
+    assert "ValueError" in str(record[0].message)
+    assert record[0].filename == __file__
+    assert record[0].lineno == lineno
+
+    # used errors, and values, are fine
+    e = Error(KeyError())
+    with pytest.raises(KeyError):
+        e.unwrap()
+    v = Value(1)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        del e, v
+        gc.collect()
+
+
+def test_leak_detection_disable():
+    instrument.enable_leak_detection()
+    e = Error(KeyError())
+    instrument.disable_leak_detection()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        del e
+        gc.collect()
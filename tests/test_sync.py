@@ -1,11 +1,19 @@
+import copy
+import gc
+import pickle
 import sys
+import threading
 import traceback
+import weakref
 
 import pytest
 
 import outcome
 from outcome import AlreadyUsedError, Error, Value
 
+if sys.version_info < (3, 11):
+    from exceptiongroup import BaseExceptionGroup, ExceptionGroup
+
 
 def test_Outcome():
     v = Value(1)
@@ -106,6 +114,88 @@ def test_capture():
 def test_inheritance():
     assert issubclass(Value, outcome.Outcome)
     assert issubclass(Error, outcome.Outcome)
+    assert isinstance(Value(1), outcome.Outcome)
+    assert not isinstance(1, outcome.Outcome)
+
+
+def test_Outcome_is_abstract():
+    assert outcome.Outcome.__abstractmethods__ == {
+        'unwrap', 'send', 'asend', 'map', 'map_error', 'and_then', 'unwrap_or',
+        'to_bytes'
+    }
+    with pytest.raises(TypeError, match="abstract"):
+        outcome.Outcome()
+
+    class Partial(outcome.Outcome):
+        def unwrap(self, *, release=False):
+            pass
+
+    assert 'unwrap' not in Partial.__abstractmethods__
+    assert 'send' in Partial.__abstractmethods__
+    with pytest.raises(TypeError, match="abstract"):
+        Partial()
+
+
+def test_combinators():
+    assert Value(1).map(str) == Value("1")
+    assert Value(1).and_then(lambda x: Value(x + 1)) == Value(2)
+    assert Value(1).unwrap_or(None) == 1
+    assert Value(1).map_error(pytest.fail) == Value(1)
+
+    exc = KeyError()
+    assert Error(exc).map(pytest.fail).error is exc
+    assert Error(exc).and_then(pytest.fail).error is exc
+    assert Error(exc).unwrap_or(None) is None
+    new = RuntimeError()
+    assert Error(exc).map_error(lambda e: new).error is new
+
+    # fn raising is captured, with map()'s frame hidden from the traceback
+    e = Value("x").map(int)
+    assert type(e.error) is ValueError
+    assert e.error.__traceback__ is None
+    e = Value("x").and_then(int)
+    assert type(e.error) is ValueError
+    e = Error(exc).map_error(int)
+    assert type(e.error) is TypeError
+
+    # returning something that isn't an exception is captured too, without
+    # losing the original exception
+    e = Error(exc).map_error(lambda e: "oops")
+    assert type(e.error) is TypeError
+    assert e.error.__cause__ is exc
+    # and likewise for and_then() returning something that isn't an outcome
+    e = Value(1).and_then(lambda x: x + 1)
+    assert type(e.error) is TypeError
+
+    # each one uses up the outcome it was called on
+    for method, arg in [
+        ("map", str),
+        ("map_error", RuntimeError),
+        ("and_then", Value),
+        ("unwrap_or", None),
+    ]:
+        for o in [Value(1), Error(KeyError())]:
+            getattr(o, method)(arg)
+            with pytest.raises(AlreadyUsedError):
+                getattr(o, method)(arg)
+            with pytest.raises(AlreadyUsedError):
+                o.unwrap()
+
+
+def test_Error_map_keeps_lazy_traceback_trimming():
+    def raise_ValueError():
+        raise ValueError
+
+    e = outcome.capture(raise_ValueError).map(str).map(str)
+    assert e.error.__traceback__.tb_frame.f_code is raise_ValueError.__code__
+
+
+def test_tags():
+    v = Value(1)
+    e = Error(KeyError())
+    assert v.is_value and not v.is_error
+    assert e.is_error and not e.is_value
+    assert Value.is_value and Error.is_error
 
 
 def test_traceback_frame_removal():
@@ -137,3 +227,574 @@ def test_Error_unwrap_does_not_create_reference_cycles():
     unwrap_frame = exc.__traceback__.tb_next.tb_frame
     assert unwrap_frame.f_code.co_name == "unwrap"
     assert unwrap_frame.f_locals == {}
+
+
+def test_capture_many():
+    def div(x, y):
+        return x / y
+
+    results = outcome.capture_many(div, [(6, 3), (1, 0), (5, 2)])
+    assert type(results) is outcome.CapturedBatch
+    assert len(results) == 3
+    assert [results.is_error(i) for i in range(3)] == [False, True, False]
+    assert results[0] == Value(2)
+    e = results[1]
+    assert type(e) is Error
+    assert type(e.error) is ZeroDivisionError
+    assert results[-1] == Value(2.5)
+
+    # each item can only be taken out once, like an outcome can only be used
+    # once
+    with pytest.raises(AlreadyUsedError):
+        results[0]
+    with pytest.raises(AlreadyUsedError):
+        list(results)
+    assert results.is_error(1)
+    with pytest.raises(IndexError):
+        results[3]
+    with pytest.raises(TypeError):
+        results[0:1]
+
+    kinds = [o.is_value for o in outcome.capture_many(div, [(1, 1), (1, 0)])]
+    assert kinds == [True, False]
+    assert len(outcome.capture_many(div, [])) == 0
+
+    # the exceptions' tracebacks don't lead back to the batch
+    batch = outcome.capture_many(div, [(1, 0)])
+    frame = batch._payloads[0].__traceback__.tb_frame
+    assert frame.f_code.co_name == 'capture_many'
+    assert not any(v is batch._payloads for v in frame.f_locals.values())
+
+    with pytest.raises(ZeroDivisionError) as exc_info:
+        e.unwrap()
+    frames = traceback.extract_tb(exc_info.value.__traceback__)
+    functions = [function for _, _, function, _ in frames]
+    assert functions[-2:] == ['unwrap', 'div']
+
+
+def test_pickle():
+    v = Value([1, 2])
+    v.unwrap()
+    v2 = pickle.loads(pickle.dumps(v))
+    assert v2 == v
+    # the copy hasn't been used yet
+    assert v2.unwrap() == [1, 2]
+
+    exc = ValueError("oops")
+    e = Error(exc)
+    with pytest.raises(ValueError):
+        e.unwrap()
+    e2 = pickle.loads(pickle.dumps(e))
+    assert type(e2.error) is ValueError
+    assert e2.error.args == ("oops",)
+    with pytest.raises(ValueError):
+        e2.unwrap()
+
+    assert copy.copy(v) == v
+
+
+def test_to_bytes():
+    v = Value({"a": 1})
+    data = v.to_bytes()
+    assert isinstance(data, bytes)
+    v2 = outcome.Outcome.from_bytes(data)
+    assert v2 == v
+    assert type(v2) is Value
+    # serializing doesn't use up the outcome
+    assert v.unwrap() == {"a": 1}
+
+    def raise_ValueError(x):
+        raise ValueError(x)
+
+    e = outcome.capture(raise_ValueError, "abc")
+    e2 = outcome.Outcome.from_bytes(e.to_bytes())
+    assert type(e2) is Error
+    assert type(e2.error) is ValueError
+    assert e2.error.args == ("abc",)
+    assert e2.error.__cause__ is None
+    assert len(e.to_bytes()) < len(e.to_bytes(keep_traceback=True))
+
+    e3 = outcome.Outcome.from_bytes(e.to_bytes(keep_traceback=True))
+    cause = e3.error.__cause__
+    assert cause is not None
+    assert "raise_ValueError" in str(cause)
+    assert "ValueError: abc" in str(cause)
+    with pytest.raises(ValueError) as exc_info:
+        e3.unwrap()
+    assert "raise_ValueError" in "".join(
+        traceback.format_exception(exc_info.type, exc_info.value, exc_info.tb)
+    )
+
+    # no traceback to keep
+    e4 = Error(KeyError())
+    data = e4.to_bytes(keep_traceback=True)
+    assert outcome.Outcome.from_bytes(data).error.__cause__ is None
+
+    with pytest.raises(ValueError):
+        outcome.Outcome.from_bytes(b"")
+    with pytest.raises(ValueError):
+        outcome.Outcome.from_bytes(b"\x7fV" + data[2:])
+    with pytest.raises(ValueError):
+        outcome.Outcome.from_bytes(data[:1] + b"?" + data[2:])
+
+
+def test_trusted_constructors():
+    from outcome._impl import _make_error, _make_value
+
+    v = _make_value([1])
+    assert type(v) is Value
+    assert v == Value([1])
+    assert v.unwrap() == [1]
+    with pytest.raises(AlreadyUsedError):
+        v.unwrap()
+
+    exc = KeyError()
+    e = _make_error(exc)
+    assert type(e) is Error
+    assert e == Error(exc)
+    assert hash(e) == hash(Error(exc))
+    with pytest.raises(KeyError):
+        e.unwrap()
+    with pytest.raises(AlreadyUsedError):
+        e.unwrap()
+
+
+def test_frozen():
+    v = Value(1)
+    e = Error(KeyError())
+    for o, name in [(v, "value"), (e, "error"), (v, "_unused")]:
+        with pytest.raises(AttributeError):
+            setattr(o, name, None)
+        with pytest.raises(AttributeError):
+            delattr(o, name)
+    with pytest.raises(AttributeError):
+        v.other = 1
+    with pytest.raises(TypeError):
+        outcome.Outcome()
+    # outcomes can be weakly referenced
+    assert weakref.ref(v)() is v
+
+
+def test_traceback_frame_removal_is_lazy():
+    def raise_ValueError(x):
+        raise ValueError(x)
+
+    e = outcome.capture(raise_ValueError, 'abc')
+    exc = e._error
+    # nothing has looked at the exception yet, so it's untouched
+    assert exc.__traceback__.tb_frame.f_code.co_name == 'capture'
+    # and comparing or hashing doesn't count as looking at it
+    assert e == e
+    hash(e)
+    assert exc.__traceback__.tb_frame.f_code.co_name == 'capture'
+    assert e.error is exc
+    assert exc.__traceback__.tb_frame.f_code.co_name == 'raise_ValueError'
+    # only trimmed once
+    assert e.error.__traceback__.tb_frame.f_code.co_name == 'raise_ValueError'
+
+    def expect_ValueError():
+        with pytest.raises(ValueError) as exc_info:
+            yield
+        frames = traceback.extract_tb(exc_info.value.__traceback__)
+        yield [function for _, _, function, _ in frames]
+
+    e = outcome.capture(raise_ValueError, 'abc')
+    it = expect_ValueError()
+    next(it)
+    assert e.send(it)[-2:] == ['expect_ValueError', 'raise_ValueError']
+
+    # if the exception was raised again in the meantime, leave it alone
+    e = outcome.capture(raise_ValueError, 'abc')
+    try:
+        raise e._error
+    except ValueError as exc:
+        tb = exc.__traceback__
+    assert e.error.__traceback__ is tb
+
+
+class Marker:
+    pass
+
+
+class MarkerError(Exception):
+    pass
+
+
+def test_captured():
+    @outcome.captured
+    def add(x, y=0):
+        """Docstring."""
+        return x + y
+
+    assert add(1, y=2) == Value(3)
+    assert add.__name__ == "add"
+    assert add.__doc__ == "Docstring."
+    assert add.__wrapped__(1) == 1
+
+    e = add(1, "x")
+    assert type(e.error) is TypeError
+    # the wrapper frame is hidden from the traceback
+    frame = e.error.__traceback__.tb_frame
+    assert frame.f_code is add.__wrapped__.__code__
+
+
+def test_capture_light():
+    assert outcome.capture_light(len, "abc") == Value(3)
+
+    refs = []
+
+    def raise_with_locals():
+        local = Marker()
+        refs.append(weakref.ref(local))
+        try:
+            raise KeyError("inner")
+        except KeyError as exc:
+            raise ValueError("outer") from exc
+
+    e = outcome.capture(raise_with_locals)
+    gc.collect()
+    assert refs[0]() is not None
+    del e
+    gc.collect()
+    assert refs[0]() is None
+
+    e = outcome.capture_light(raise_with_locals)
+    gc.collect()
+    assert refs[1]() is None
+    assert type(e.error) is ValueError
+    assert e.error.__traceback__ is None
+    assert type(e.error.__cause__) is KeyError
+    assert e.error.__cause__.__traceback__ is None
+    assert e.error.__context__ is e.error.__cause__
+    with pytest.raises(ValueError):
+        e.unwrap()
+
+
+def test_capture_light_keeps_handled_exception():
+    def fail():
+        raise KeyError
+
+    try:
+        1 / 0
+    except ZeroDivisionError as handled:
+        e = outcome.capture_light(fail)
+        # the new exception is cleared, up to the one being handled
+        assert e.error.__traceback__ is None
+        assert e.error.__context__ is handled
+        tb = handled.__traceback__
+        assert tb is not None
+        assert tb.tb_frame is sys._getframe()
+
+    with pytest.raises(ZeroDivisionError) as exc_info:
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            outcome.capture_light(fail)
+            raise
+    # re-raised with the frame of 1 / 0 intact
+    lines = [
+        f.line for f in traceback.extract_tb(exc_info.value.__traceback__)
+    ]
+    assert "1 / 0" in lines
+
+
+def test_capture_light_exception_group():
+    def raise_group():
+        try:
+            raise KeyError
+        except KeyError as exc:
+            inner = exc
+        raise ExceptionGroup("group", [inner])
+
+    e = outcome.capture_light(raise_group)
+    assert e.error.__traceback__ is None
+    assert e.error.exceptions[0].__traceback__ is None
+
+
+def test_partition():
+    key_error = KeyError()
+    value_error = ValueError()
+    outcomes = [Value(1), Error(key_error), Value(2), Error(value_error)]
+    assert outcome.partition(outcomes) == ([1, 2], [key_error, value_error])
+    for o in outcomes:
+        with pytest.raises(AlreadyUsedError):
+            o.unwrap()
+    assert outcome.partition([]) == ([], [])
+    assert outcome.partition(iter([Value(1)])) == ([1], [])
+
+    used = Value(3)
+    used.unwrap()
+    with pytest.raises(AlreadyUsedError):
+        outcome.partition([Value(1), used])
+
+
+def test_gather_outcomes():
+    assert outcome.gather_outcomes([Value(1), Value(2)]) == Value([1, 2])
+    assert outcome.gather_outcomes([]) == Value([])
+
+    def raise_KeyError():
+        raise KeyError
+
+    outcomes = [Value(1), outcome.capture(raise_KeyError), Value(2)]
+    e = outcome.gather_outcomes(outcomes)
+    assert type(e.error) is ExceptionGroup
+    [inner] = e.error.exceptions
+    assert type(inner) is KeyError
+    # the capture frame was trimmed from the inner traceback
+    assert inner.__traceback__.tb_frame.f_code is raise_KeyError.__code__
+    for o in outcomes:
+        with pytest.raises(AlreadyUsedError):
+            o.unwrap()
+
+    e = outcome.gather_outcomes(
+        [Error(KeyboardInterrupt()),
+         Error(KeyError())]
+    )
+    assert type(e.error) is BaseExceptionGroup
+    assert len(e.error.exceptions) == 2
+
+
+def gen_then_raise():
+    yield 1
+    yield 2
+    raise KeyError
+
+
+def test_capture_iter():
+    results = list(outcome.capture_iter(gen_then_raise()))
+    assert results[:2] == [Value(1), Value(2)]
+    assert type(results[2].error) is KeyError
+    assert len(results) == 3
+    # the capture_iter frame is hidden from the traceback
+    frame = results[2].error.__traceback__.tb_frame
+    assert frame.f_code is gen_then_raise.__code__
+
+    assert list(outcome.capture_iter([1, 2])) == [Value(1), Value(2)]
+    [e] = outcome.capture_iter(1)
+    assert type(e.error) is TypeError
+
+    # lazy, and closing the stream isn't captured
+    it = outcome.capture_iter(iter(int, 1))
+    assert next(it) == Value(0)
+    it.close()
+
+
+def test_capture_iter_chunks():
+    chunks = list(outcome.capture_iter_chunks(range(5), 2))
+    assert chunks == [
+        [Value(0), Value(1)],
+        [Value(2), Value(3)],
+        [Value(4)],
+    ]
+    assert list(outcome.capture_iter_chunks(range(4), 2)) == [
+        [Value(0), Value(1)],
+        [Value(2), Value(3)],
+    ]
+    assert list(outcome.capture_iter_chunks([], 2)) == []
+
+    chunks = list(outcome.capture_iter_chunks(gen_then_raise(), 2))
+    assert len(chunks) == 2
+    assert chunks[0] == [Value(1), Value(2)]
+    [e] = chunks[1]
+    assert type(e.error) is KeyError
+
+    [[e]] = outcome.capture_iter_chunks(1, 2)
+    assert type(e.error) is TypeError
+
+    with pytest.raises(ValueError):
+        outcome.capture_iter_chunks([], 0)
+
+
+def test_release():
+    payload = Marker()
+    ref = weakref.ref(payload)
+    v = Value(payload)
+    assert v.unwrap(release=True) is payload
+    del payload
+    gc.collect()
+    assert ref() is None
+    with pytest.raises(AlreadyUsedError):
+        v.value
+    with pytest.raises(AlreadyUsedError):
+        v.unwrap()
+    assert repr(v) == "Value(<released>)"
+
+    exc = MarkerError()
+    ref = weakref.ref(exc)
+    e = Error(exc)
+    with pytest.raises(MarkerError):
+        e.unwrap(release=True)
+    del exc
+    gc.collect()
+    assert ref() is None
+    with pytest.raises(AlreadyUsedError):
+        e.error
+    with pytest.raises(AlreadyUsedError):
+        e.unwrap(release=True)
+    assert repr(e) == "Error(<released>)"
+
+    def expect_values():
+        assert (yield) == 1
+        with pytest.raises(KeyError):
+            yield
+        yield "ok"
+
+    it = expect_values()
+    next(it)
+    v = Value(1)
+    e = Error(KeyError())
+    v.send(it, release=True)
+    assert e.send(it, release=True) == "ok"
+    with pytest.raises(AlreadyUsedError):
+        v.value
+    with pytest.raises(AlreadyUsedError):
+        e.error
+
+    # without release=True the contents stay around
+    v = Value(1)
+    v.unwrap()
+    assert v.value == 1
+
+    # comparing and hashing go by the contents, so they don't work once
+    # those are released, which is why released outcomes mustn't be used as
+    # dict keys or set members
+    for o in [Value(1), Error(KeyError())]:
+        d = {o: 1}
+        try:
+            o.unwrap(release=True)
+        except KeyError:
+            pass
+        with pytest.raises(AlreadyUsedError):
+            o in d
+        with pytest.raises(AlreadyUsedError):
+            hash(o)
+        with pytest.raises(AlreadyUsedError):
+            o == o
+        # keying by id() keeps working
+        assert id(o) in {id(o): 1}
+
+
+def test_unwrap_is_thread_safe():
+    # Race many threads to use the same outcome; exactly one should win.
+    n_threads = 8
+    for _ in range(200):
+        v = Value(1)
+        barrier = threading.Barrier(n_threads)
+        results = []
+
+        def use():
+            barrier.wait()
+            try:
+                results.append(v.unwrap())
+            except AlreadyUsedError:
+                results.append(None)
+
+        threads = [threading.Thread(target=use) for _ in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results.count(1) == 1
+        assert results.count(None) == n_threads - 1
+
+
+def test_drive():
+    def doubler():
+        total = 0
+        while True:
+            try:
+                x = yield total
+            except KeyError:
+                return "done"
+            total = x * 2
+
+    gen = doubler()
+    next(gen)
+    exc = KeyError()
+    outcomes = [Value(1), Value(2), Error(exc), Value(3)]
+    results = outcome.drive(gen, outcomes)
+    assert results[:2] == [Value(2), Value(4)]
+    assert type(results[2].error) is StopIteration
+    assert results[2].error.value == "done"
+    assert len(results) == 3
+    # the last outcome wasn't needed, so it's still usable
+    assert outcomes[3].unwrap() == 3
+    with pytest.raises(AlreadyUsedError):
+        outcomes[0].unwrap()
+
+    def fails():
+        yield
+        raise ValueError("oops")
+
+    gen = fails()
+    next(gen)
+    results = outcome.drive(gen, [Value(None)])
+    assert type(results[0].error) is ValueError
+    frames = traceback.extract_tb(results[0].error.__traceback__)
+    assert [function for _, _, function, _ in frames] == ['fails']
+
+    gen = doubler()
+    next(gen)
+    used = Value(1)
+    used.unwrap()
+    with pytest.raises(AlreadyUsedError):
+        outcome.drive(gen, [used])
+
+    assert outcome.drive(gen, []) == []
+
+
+def test_step():
+    def task():
+        x = yield "first"
+        try:
+            yield x
+        except KeyError:
+            pass
+        return "result"
+
+    coro = task()
+    assert outcome.step(coro, Value(None)) == ("first", None)
+    assert outcome.step(coro, Value(2)) == (2, None)
+    assert outcome.step(coro, Error(KeyError())) == (None, Value("result"))
+
+    def fails():
+        yield
+        raise ValueError("oops")
+
+    coro = fails()
+    outcome.step(coro, Value(None))
+    yielded, final = outcome.step(coro, Value(None))
+    assert yielded is None
+    assert type(final.error) is ValueError
+    frames = traceback.extract_tb(final.error.__traceback__)
+    assert [function for _, _, function, _ in frames] == ['fails']
+
+    used = Value(None)
+    used.unwrap()
+    with pytest.raises(AlreadyUsedError):
+        outcome.step(task(), used)
+
+
+def test_Value_reset():
+    v = Value(None)
+    v.reset()  # no-op on an unused value
+    assert v.unwrap() is None
+    v.reset()
+    assert v.unwrap() is None
+    with pytest.raises(AlreadyUsedError):
+        v.unwrap()
+
+    def gen():
+        while True:
+            assert (yield) is None
+
+    it = gen()
+    next(it)
+    for _ in range(3):
+        v.reset()
+        v.send(it)
+
+    v = Value(1)
+    v.unwrap(release=True)
+    with pytest.raises(AlreadyUsedError):
+        v.reset()
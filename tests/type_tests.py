@@ -62,6 +62,90 @@ def maybe_test_err_first(maybe: Maybe[float]) -> None:
             assert_never(maybe)
 
 
+def maybe_test_tags(maybe: Maybe[float]) -> None:
+    """Check narrowing on the is_value/is_error tags."""
+    if maybe.is_value:
+        assert_type(maybe, Value[float])
+        assert_type(maybe.value, float)
+    else:
+        assert_type(maybe, Error)
+    if maybe.is_error:
+        assert_type(maybe, Error)
+    else:
+        assert_type(maybe, Value[float])
+
+
+def combinator_test(maybe: Maybe[float]) -> None:
+    """Check the types produced by the combinators."""
+    assert_type(maybe.map(str), Union[Value[str], Error])
+    assert_type(maybe.map_error(RuntimeError), Union[Value[float], Error])
+    assert_type(
+        maybe.and_then(lambda x: capture(int, x)), Union[Value[int], Error]
+    )
+    assert_type(maybe.unwrap_or(None), Union[float, None])
+    assert_type(Value(1).map_error(RuntimeError), Value[int])
+    assert_type(Error(KeyError()).map(str), Error)
+    assert_type(Error(KeyError()).unwrap_or(''), str)
+
+
+async def captured_test() -> None:
+    """Check the decorators keep the signature."""
+
+    @outcome.captured
+    def sync_fn(x: int, *, y: str = '') -> float:
+        return 1.0
+
+    @outcome.captured
+    async def async_fn(x: int) -> str:
+        return ''
+
+    @outcome.acaptured
+    async def async_fn2(x: int) -> str:
+        return ''
+
+    assert_type(sync_fn(1, y='a'), Union[Value[float], Error])
+    sync_fn('a')  # type: ignore[arg-type]
+    sync_fn(1, z=2)  # type: ignore[call-arg]
+    assert_type(await async_fn(1), Union[Value[str], Error])
+    assert_type(await async_fn2(1), Union[Value[str], Error])
+
+
+async def memoize_test() -> None:
+    """Check the memoized function keeps the signature."""
+    from outcome.cache import CacheInfo, memoize
+
+    @memoize(maxsize=10, error_ttl=1.0)
+    def sync_fn(x: int) -> float:
+        return 1.0
+
+    @memoize()
+    async def async_fn(x: int) -> str:
+        return ''
+
+    assert_type(sync_fn(1), Union[Value[float], Error])
+    sync_fn('a')  # type: ignore[arg-type]
+    assert_type(await async_fn(1), Union[Value[str], Error])
+    assert_type(sync_fn.cache_info(), CacheInfo)
+    async_fn.cache_clear()
+
+    @memoize
+    def bare_sync_fn(x: int) -> float:
+        return 1.0
+
+    @memoize
+    async def bare_async_fn(x: int) -> str:
+        return ''
+
+    assert_type(bare_sync_fn(1), Union[Value[float], Error])
+    assert_type(await bare_async_fn(1), Union[Value[str], Error])
+    assert_type(bare_sync_fn.cache_info(), CacheInfo)
+
+
+def abstract_test() -> None:
+    """Check Outcome is still abstract to type checkers."""
+    Outcome()  # type: ignore[abstract]
+
+
 def value_variance_test() -> None:
     """Check variance behaves as expected."""
     value: Value[Super]
@@ -119,6 +203,11 @@ def sync_capture_test() -> None:
     assert_type(capture(sync_raises), Error)
     capture(sync_one)  # type: ignore[call-overload]
     capture(sync_none, 1, 2)  # type: ignore[call-overload]
+    batch = outcome.capture_many(sync_one, [(1.0,)])
+    assert_type(batch, outcome.CapturedBatch[int])
+    assert_type(batch[0], Union[Value[int], Error])
+    for item in batch:
+        assert_type(item, Union[Value[int], Error])
 
 
 async def sync_gen_test() -> None: